@@ -1,16 +1,17 @@
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.models import Project, Job, JobStatus
 from app.config import settings
 from app.services.tasks import celery_app, pipeline_task
-import os
+from app.services.render import get_s3_client, MINIO_BUCKET
+import io
 import asyncio
-import tempfile
+import mimetypes
+import posixpath
 import zipfile
-import boto3
 
 router = APIRouter()
 
@@ -112,38 +113,28 @@ async def set_job_status(job_id: int, status: str, output_zip_url: str = None, e
         await db.commit()
     return {"ok": True}
 
-async def download_and_extract_zip(job_id: int) -> str:
-    """Download ZIP from MinIO and extract to temp directory"""
-    minio_endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000")
-    minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
-    minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
-    minio_bucket = os.getenv("MINIO_BUCKET", "pagelift-assets")
-    
-    if not minio_endpoint.startswith(('http://', 'https://')):
-        minio_endpoint = f"http://{minio_endpoint}"
-    
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=minio_endpoint,
-        aws_access_key_id=minio_access_key,
-        aws_secret_access_key=minio_secret_key,
-        region_name="us-east-1",
-    )
-    
+async def download_site_zip(job_id: int) -> bytes:
+    """Download the site ZIP from MinIO into memory"""
+    s3 = get_s3_client()
     key = f"S3_GENERATED/site_{job_id}.zip"
-    temp_dir = tempfile.mkdtemp()
-    zip_path = os.path.join(temp_dir, "site.zip")
+    
+    def fetch() -> bytes:
+        obj = s3.get_object(Bucket=MINIO_BUCKET, Key=key)
+        return obj["Body"].read()
     
     try:
-        s3.download_file(minio_bucket, key, zip_path)
+        # boto3 blocks, so download on a worker thread to keep the event loop free
+        return await asyncio.to_thread(fetch)
     except Exception as e:
         raise HTTPException(status_code=404, detail="Site file not found")
-    
-    extract_dir = os.path.join(temp_dir, "extracted")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_dir)
-    
-    return extract_dir
+
+def read_site_file(zip_bytes: bytes, file_path: str) -> bytes:
+    """Read one file out of a site ZIP without extracting it to disk"""
+    name = posixpath.normpath(file_path.lstrip('/'))
+    if name.startswith('..'):
+        raise KeyError(file_path)
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_ref:
+        return zip_ref.read(name)
 
 @router.get("/jobs/{job_id}/preview", response_class=HTMLResponse)
 async def preview_site(job_id: int):
@@ -154,15 +145,13 @@ async def preview_site(job_id: int):
         if job.status != JobStatus.complete or not job.output_zip_url:
             raise HTTPException(status_code=400, detail="Job not complete or no output available")
     
-    extract_dir = await download_and_extract_zip(job_id)
-    index_path = os.path.join(extract_dir, "index.html")
+    zip_bytes = await download_site_zip(job_id)
     
-    if not os.path.exists(index_path):
+    try:
+        html_content = read_site_file(zip_bytes, "index.html").decode('utf-8')
+    except KeyError:
         raise HTTPException(status_code=404, detail="Site index.html not found")
     
-    with open(index_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
     return HTMLResponse(content=html_content)
 
 @router.get("/jobs/{job_id}/preview/assets/{file_path:path}")
@@ -174,13 +163,15 @@ async def preview_assets(job_id: int, file_path: str):
         if job.status != JobStatus.complete or not job.output_zip_url:
             raise HTTPException(status_code=400, detail="Job not complete or no output available")
     
-    extract_dir = await download_and_extract_zip(job_id)
-    asset_path = os.path.join(extract_dir, file_path)
+    zip_bytes = await download_site_zip(job_id)
     
-    if not os.path.exists(asset_path) or not os.path.commonpath([extract_dir, asset_path]) == extract_dir:
+    try:
+        content = read_site_file(zip_bytes, file_path)
+    except KeyError:
         raise HTTPException(status_code=404, detail="Asset not found")
     
-    return FileResponse(asset_path)
+    media_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    return Response(content=content, media_type=media_type)
 
 @router.get("/jobs/{job_id}/download")
 async def download_site(job_id: int):
@@ -191,36 +182,13 @@ async def download_site(job_id: int):
         if job.status != JobStatus.complete or not job.output_zip_url:
             raise HTTPException(status_code=400, detail="Job not complete or no output available")
     
-    # Download from MinIO and serve as file
-    minio_endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000")
-    minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
-    minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
-    minio_bucket = os.getenv("MINIO_BUCKET", "pagelift-assets")
-    
-    if not minio_endpoint.startswith(('http://', 'https://')):
-        minio_endpoint = f"http://{minio_endpoint}"
-    
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=minio_endpoint,
-        aws_access_key_id=minio_access_key,
-        aws_secret_access_key=minio_secret_key,
-        region_name="us-east-1",
-    )
-    
-    key = f"S3_GENERATED/site_{job_id}.zip"
-    temp_dir = tempfile.mkdtemp()
-    zip_path = os.path.join(temp_dir, f"site_{job_id}.zip")
-    
-    try:
-        s3.download_file(minio_bucket, key, zip_path)
-    except Exception as e:
-        raise HTTPException(status_code=404, detail="Site file not found")
+    # Download from MinIO and serve straight from memory
+    zip_bytes = await download_site_zip(job_id)
     
-    return FileResponse(
-        path=zip_path,
-        filename=f"pagelift_site_{job_id}.zip",
-        media_type="application/zip"
+    return Response(
+        content=zip_bytes,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="pagelift_site_{job_id}.zip"'}
     )
 
 @router.get("/debug/job/{job_id}/extraction")
@@ -322,7 +290,7 @@ async def debug_job_comparison(job_id: int):
                 return {"error": f"Could not fetch original page: {str(e)}"}
             
             # Analyze original content
-            soup = BeautifulSoup(original_html, 'html.parser')
+            soup = BeautifulSoup(original_html, 'lxml')
             original_text = soup.get_text()
             original_words = len(original_text.split())
             original_images = len(soup.find_all('img'))
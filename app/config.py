@@ -9,6 +9,8 @@ class Settings(BaseSettings):
     MINIO_ACCESS_KEY: str = "minioadmin"
     MINIO_SECRET_KEY: str = "minioadmin"
     MINIO_BUCKET: str = "pagelift-assets"
+    JINJA_CACHE_DIR: str = "/tmp/pagelift_jinja_cache"
+    JINJA_PRECOMPILED_TEMPLATES: str = ""
 
     class Config:
         env_file = ".env"
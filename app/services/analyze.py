@@ -110,25 +110,28 @@ def estimate_tokens(text: str) -> int:
     """Rough token estimation: ~4 characters per token"""
     return len(text) // 4
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Boilerplate that adds tokens without telling the model anything about the section
+_NOISE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\bcookie\b.*?policy\b.*?(?:\.|$)',  # Cookie notices
+    r'\bterms\b.*?service\b.*?(?:\.|$)',  # Terms of service
+    r'\bprivacy\b.*?policy\b.*?(?:\.|$)',  # Privacy policy
+    r'\b(?:follow|like|share)\s+(?:us\s+)?on\s+(?:facebook|twitter|instagram|linkedin)\b.*?(?:\.|$)',  # Social media
+    r'\b\d{4}\s+(?:all\s+)?rights?\s+reserved\b.*?(?:\.|$)',  # Copyright
+)]
+
 def clean_text_content(text: str) -> str:
     """Remove HTML noise and optimize content for AI analysis"""
     if not text:
         return ""
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_RE.sub(' ', text.strip())
     
     # Remove common noise patterns
-    noise_patterns = [
-        r'\bcookie\b.*?policy\b.*?(?:\.|$)',  # Cookie notices
-        r'\bterms\b.*?service\b.*?(?:\.|$)',  # Terms of service
-        r'\bprivacy\b.*?policy\b.*?(?:\.|$)',  # Privacy policy
-        r'\b(?:follow|like|share)\s+(?:us\s+)?on\s+(?:facebook|twitter|instagram|linkedin)\b.*?(?:\.|$)',  # Social media
-        r'\b\d{4}\s+(?:all\s+)?rights?\s+reserved\b.*?(?:\.|$)',  # Copyright
-    ]
-    
-    for pattern in noise_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    for pattern in _NOISE_PATTERNS:
+        text = pattern.sub('', text)
     
     # Limit very long text blocks to avoid token explosion
     if len(text) > 1000:
@@ -15,6 +15,30 @@ from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Style-scanning patterns, compiled once rather than on every extraction.
+# Color patterns are tightened to avoid partial matches
+_COLOR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
+    r'background-color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
+    r'background:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
+    r'border-color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
+    r'#([0-9A-Fa-f]{6}|[0-9A-Fa-f]{3})\b',  # Only complete hex colors
+    r'rgb\([^\)]+\)',
+    r'rgba\([^\)]+\)',
+    r'hsl\([^\)]+\)',
+    r'hsla\([^\)]+\)',
+)]
+_FONT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'font-family:\s*([^;}\n]+)',
+    r'font:\s*[^;}\n]*?([\'"][^\'"]+"[\'"][^;}\n]*)',
+)]
+_INLINE_COLOR_RE = re.compile(r'(?:color|background-color|background):\s*([#\w\(\),\s\%\.]+)')
+_FONT_SIZE_RE = re.compile(r'font-size:\s*([^;}\n]+)', re.IGNORECASE)
+_FONT_WEIGHT_RE = re.compile(r'font-weight:\s*([^;}\n]+)', re.IGNORECASE)
+_BORDER_RADIUS_RE = re.compile(r'border-radius:\s*([^;}\n]+)', re.IGNORECASE)
+_BOX_SHADOW_RE = re.compile(r'box-shadow:\s*([^;}\n]+)', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'\d+')
+
 @dataclass
 class ColorPalette:
     """Extracted color scheme from original website"""
@@ -149,7 +173,7 @@ class BrandExtractor:
         try:
             logger.info(f"Starting brand extraction for: {url}")
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             
             # Extract CSS and styles
             css_content = self._extract_css_content(soup, url)
@@ -227,24 +251,10 @@ class BrandExtractor:
         """Extract and analyze color palette from CSS and HTML"""
         colors = []
         
-        # Extract colors from CSS - improved patterns to avoid partial matches
-        color_patterns = [
-            r'color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
-            r'background-color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
-            r'background:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
-            r'border-color:\s*([#][0-9A-Fa-f]{3,6}|rgb[a]?\([^\)]+\)|hsl[a]?\([^\)]+\)|\b(?:red|blue|green|black|white|gray|grey|yellow|orange|purple|pink|brown|cyan|magenta|lime|navy|teal|olive|silver|maroon|aqua|fuchsia)\b)',
-            r'#([0-9A-Fa-f]{6}|[0-9A-Fa-f]{3})\b',  # Only complete hex colors
-            r'rgb\([^\)]+\)',
-            r'rgba\([^\)]+\)',
-            r'hsl\([^\)]+\)',
-            r'hsla\([^\)]+\)',
-        ]
-        
         all_styles = css_content + " ".join(inline_styles)
         
-        for pattern in color_patterns:
-            matches = re.findall(pattern, all_styles, re.IGNORECASE)
-            colors.extend(matches)
+        for pattern in _COLOR_PATTERNS:
+            colors.extend(pattern.findall(all_styles))
         
         # Clean and categorize colors with robust error handling
         cleaned_colors = []
@@ -268,18 +278,12 @@ class BrandExtractor:
     def _extract_typography(self, css_content: str, inline_styles: List[str], soup: BeautifulSoup) -> Typography:
         """Extract typography system from CSS and HTML"""
         
-        # Extract font families
-        font_patterns = [
-            r'font-family:\s*([^;}\n]+)',
-            r'font:\s*[^;}\n]*?([\'"][^\'"]+"[\'"][^;}\n]*)',
-        ]
-        
         all_styles = css_content + " ".join(inline_styles)
         fonts = []
         
-        for pattern in font_patterns:
-            matches = re.findall(pattern, all_styles, re.IGNORECASE)
-            fonts.extend(matches)
+        # Extract font families
+        for pattern in _FONT_PATTERNS:
+            fonts.extend(pattern.findall(all_styles))
         
         # Clean font names
         cleaned_fonts = []
@@ -414,7 +418,7 @@ class BrandExtractor:
                 style = element.get('style', '')
                 if style:
                     # Extract colors from inline styles
-                    color_matches = re.findall(r'(?:color|background-color|background):\s*([#\w\(\),\s\%\.]+)', style)
+                    color_matches = _INLINE_COLOR_RE.findall(style)
                     primary_candidates.extend(color_matches)
         
         # Find most common color in primary contexts that isn't neutral
@@ -553,23 +557,22 @@ class BrandExtractor:
     
     def _extract_font_sizes(self, styles: str) -> Dict[str, str]:
         """Extract font size patterns from CSS"""
-        size_pattern = r'font-size:\s*([^;}\n]+)'
-        sizes = re.findall(size_pattern, styles, re.IGNORECASE)
+        sizes = _FONT_SIZE_RE.findall(styles)
         
         # Convert to standard size scale
         size_map = {}
         for size in set(sizes):
             size = size.strip()
             if 'px' in size:
-                px_value = int(re.findall(r'(\d+)', size)[0]) if re.findall(r'(\d+)', size) else 16
+                digits = _DIGITS_RE.search(size)
+                px_value = int(digits.group()) if digits else 16
                 size_map[self._px_to_size_name(px_value)] = size
         
         return size_map if size_map else None
     
     def _extract_font_weights(self, styles: str) -> Dict[str, str]:
         """Extract font weight patterns from CSS"""
-        weight_pattern = r'font-weight:\s*([^;}\n]+)'
-        weights = re.findall(weight_pattern, styles, re.IGNORECASE)
+        weights = _FONT_WEIGHT_RE.findall(styles)
         
         weight_map = {}
         for weight in set(weights):
@@ -597,8 +600,7 @@ class BrandExtractor:
     
     def _extract_border_radius(self, styles: str) -> str:
         """Extract border radius patterns"""
-        radius_pattern = r'border-radius:\s*([^;}\n]+)'
-        radii = re.findall(radius_pattern, styles, re.IGNORECASE)
+        radii = _BORDER_RADIUS_RE.findall(styles)
         
         if radii:
             # Return most common radius
@@ -609,8 +611,7 @@ class BrandExtractor:
     
     def _extract_shadows(self, styles: str) -> str:
         """Extract box shadow patterns"""
-        shadow_pattern = r'box-shadow:\s*([^;}\n]+)'
-        shadows = re.findall(shadow_pattern, styles, re.IGNORECASE)
+        shadows = _BOX_SHADOW_RE.findall(styles)
         
         if shadows:
             shadow_counter = Counter(shadows)
@@ -1,11 +1,14 @@
 from bs4 import BeautifulSoup
-from dataclasses import dataclass, asdict
+from lxml import etree
+from dataclasses import dataclass
 from typing import List, Optional
-import json
+import orjson
+import re
 from app.models import Job
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-@dataclass
+@dataclass(slots=True)
 class SectionData:
     section_id: int
     heading: Optional[str]
@@ -15,82 +18,171 @@ class SectionData:
     id: Optional[str]
 
 
+# Class/id keywords that mark a div as a likely content section
+MEANINGFUL_CLASSES = [
+    "content", "main", "container", "section", "block", "article",
+    "hero", "about", "services", "contact", "gallery", "testimonials",
+    "intro", "description", "feature", "highlight"
+]
+_MEANINGFUL_CLASS_RE = re.compile("|".join(map(re.escape, MEANINGFUL_CLASSES)), re.IGNORECASE)
+
+# Elements whose text is never page copy
+NON_CONTENT_TAGS = frozenset(["script", "style", "noscript", "template"])
+
+# Sections whose word-shingle sets overlap at least this much are near-duplicates
+SHINGLE_SIZE = 5
+DUPLICATE_SIMILARITY = 0.8
+
+
+def text_shingles(text: str) -> frozenset:
+    """Hashed lowercased word n-grams of text, used for near-duplicate detection.
+    
+    Shingles are stored as 64-bit hashes rather than word tuples; they are only
+    compared within one parse, so the per-process hash seed doesn't matter.
+    """
+    words = text.lower().split()
+    if len(words) <= SHINGLE_SIZE:
+        return frozenset([hash(tuple(words))]) if words else frozenset()
+    return frozenset(hash(tuple(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1))
+
+
+def is_near_duplicate(shingles: frozenset, seen: List[frozenset]) -> bool:
+    """Check whether shingles overlap any already accepted set by DUPLICATE_SIMILARITY or more"""
+    for other in seen:
+        small, large = sorted((len(shingles), len(other)))
+        # Jaccard can't reach the threshold when the sizes are too far apart
+        if small < DUPLICATE_SIMILARITY * large:
+            continue
+        if len(shingles & other) >= DUPLICATE_SIMILARITY * len(shingles | other):
+            return True
+    return False
+
+
 def parse_html_sections(html: str) -> List[SectionData]:
     """
     Semantic HTML parsing that creates meaningful content sections
     instead of fragmenting into every div/section element
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     sections = []
     section_id = 0
     
+    # No threshold below asks for more words than this, so counting can stop
+    # there instead of splitting the whole text into a list
+    max_min_words = 10
+    # Shortest stripped text that can count as a section
+    min_chars = 20
+    
+    def count_words(text: str) -> int:
+        """Count words in text, capped at max_min_words"""
+        return len(text.split(None, max_min_words - 1)) if text else 0
+    
     # Helper function to determine if content is substantial enough
-    def is_meaningful_content(text: str, min_words: int = 5) -> bool:
+    def is_meaningful_content(text: str, min_words: int = 5, word_count: Optional[int] = None) -> bool:
         """Check if text content is substantial enough to be a section"""
-        if not text or len(text.strip()) < 20:  # Too short
+        # Callers pass stripped text, so no need to strip it again
+        if len(text) < min_chars:  # Too short
             return False
-        word_count = len(text.split())
+        if word_count is None:
+            word_count = count_words(text)
         return word_count >= min_words
     
+    heading_tags = ("h1", "h2", "h3", "h4", "h5", "h6")
+    heading_levels = {tag: level for level, tag in enumerate(heading_tags)}
+    
+    # Per-container metadata gathered during the document walk, keyed on id(container)
+    first_headings = {}
+    container_imgs = {}
+    
     def extract_heading(element):
         """Extract the most prominent heading from an element"""
-        for heading_tag in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            heading = element.find(heading_tag)
-            if heading:
-                return heading.get_text(strip=True)
-        return None
+        first = first_headings.get(id(element))
+        return first[1].get_text(strip=True) if first else None
     
     def get_semantic_containers():
-        """Find semantic containers that likely contain meaningful sections"""
-        containers = []
+        """Find semantic containers that likely contain meaningful sections.
         
-        # 1. First priority: Semantic HTML5 elements
-        for tag in ["main", "article", "section"]:
-            for el in soup.find_all(tag):
-                text = el.get_text(" ", strip=True)
-                if is_meaningful_content(text):
-                    containers.append(el)
-        
-        # 2. Second priority: Divs with meaningful classes/content
-        meaningful_classes = [
-            "content", "main", "container", "section", "block", "article",
-            "hero", "about", "services", "contact", "gallery", "testimonials",
-            "intro", "description", "feature", "highlight"
-        ]
-        
-        for div in soup.find_all("div"):
-            classes = div.get("class", [])
-            div_id = div.get("id", "")
-            text = div.get_text(" ", strip=True)
-            
-            # Check if this div has meaningful content and semantic indicators
-            has_semantic_class = any(cls.lower() in " ".join(classes + [div_id]).lower() 
-                                   for cls in meaningful_classes)
+        Returns (element, text, word_count) tuples so callers don't re-extract text.
+        """
+        semantic = {"main": [], "article": [], "section": []}
+        divs = []
+        container_ids = set()
+        headings = []
+        imgs = []
+        
+        # Single walk over the document; ancestors are always visited before
+        # their descendants, so nesting can be decided as we go
+        for el in soup.descendants:
+            name = el.name
+            if name is None:
+                continue
             
-            if has_semantic_class and is_meaningful_content(text, min_words=10):
+            if name in semantic:
+                # 1. First priority: Semantic HTML5 elements
+                text = el.get_text(" ", strip=True)
+                if len(text) < min_chars:  # Too short; skip counting words
+                    continue
+                word_count = count_words(text)
+                if is_meaningful_content(text, word_count=word_count):
+                    semantic[name].append((el, text, word_count))
+                    container_ids.add(id(el))
+            elif name == "div":
+                # 2. Second priority: Divs with meaningful classes/content
+                haystack = " ".join(el.get("class", [])) + " " + (el.get("id") or "")
+                if not _MEANINGFUL_CLASS_RE.search(haystack):
+                    continue
+                
                 # Avoid nested containers (choose the most outer meaningful one)
-                if not any(div in container.descendants for container in containers):
-                    containers.append(div)
+                if any(id(parent) in container_ids for parent in el.parents):
+                    continue
+                
+                text = el.get_text(" ", strip=True)
+                if len(text) < min_chars:  # Too short; skip counting words
+                    continue
+                word_count = count_words(text)
+                if is_meaningful_content(text, min_words=10, word_count=word_count):
+                    divs.append((el, text, word_count))
+                    container_ids.add(id(el))
+            elif name in heading_levels:
+                headings.append(el)
+            elif name == "img":
+                imgs.append(el)
         
-        return containers
+        # Attribute headings and images to every candidate that encloses them
+        for heading in headings:
+            level = heading_levels[heading.name]
+            for parent in heading.parents:
+                key = id(parent)
+                if key in container_ids:
+                    first = first_headings.get(key)
+                    if first is None or level < first[0]:
+                        first_headings[key] = (level, heading)
+        
+        for img in imgs:
+            src = img.get("src")
+            if not src:
+                continue
+            for parent in img.parents:
+                key = id(parent)
+                if key in container_ids:
+                    # Insertion-ordered dict doubles as an ordered set of srcs
+                    container_imgs.setdefault(key, {})[src] = None
+        
+        return semantic["main"] + semantic["article"] + semantic["section"] + divs
     
     # Extract meaningful sections from semantic containers
-    processed_elements = set()
+    claimed_ids = set()
     
-    for container in get_semantic_containers():
-        if container in processed_elements:
+    for container, text, word_count in get_semantic_containers():
+        # Skip containers that sit inside (or are) an already extracted section
+        if id(container) in claimed_ids or any(id(parent) in claimed_ids for parent in container.parents):
             continue
             
-        text = container.get_text(" ", strip=True)
-        if not is_meaningful_content(text, min_words=8):
+        if not is_meaningful_content(text, min_words=8, word_count=word_count):
             continue
             
         # Extract images
-        imgs = []
-        for img in container.find_all("img"):
-            src = img.get("src")
-            if src and src not in imgs:
-                imgs.append(src)
+        imgs = list(container_imgs.get(id(container), ()))
         
         # Get heading
         heading = extract_heading(container)
@@ -109,10 +201,8 @@ def parse_html_sections(html: str) -> List[SectionData]:
         ))
         section_id += 1
         
-        # Mark this container and its descendants as processed
-        processed_elements.add(container)
-        for descendant in container.descendants:
-            processed_elements.add(descendant)
+        # Claim this container; its descendants are covered by the ancestor check above
+        claimed_ids.add(id(container))
     
     # Fallback: If we found very few sections, use heading-based extraction
     if len(sections) < 3:
@@ -143,34 +233,49 @@ def parse_html_sections(html: str) -> List[SectionData]:
                 current_section["text_parts"] = []
                 current_section["img_urls"] = []
         
-        # Walk through all elements looking for content
-        for element in soup.body.descendants if soup.body else []:
-            if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                flush_section()
-                current_section["heading"] = element.get_text(strip=True)
-            elif element.name == "img":
-                src = element.get("src")
-                if src and src not in current_section["img_urls"]:
-                    current_section["img_urls"].append(src)
-            elif element.string and element.string.strip():
-                # Only add meaningful text content
-                text = element.string.strip()
+        def add_text(text):
+            # Only add meaningful text content
+            if text:
+                text = text.strip()
                 if len(text) > 3:  # Ignore very short strings
                     current_section["text_parts"].append(text)
         
+        # Walk the body with lxml so every text node is visited exactly once, in
+        # document order: an element's .text on start, its .tail once it closes.
+        # Encoding explicitly keeps in-document charset declarations out of the way.
+        root = etree.fromstring(html.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+        body = root.find("body") if root is not None else None
+        events = ("start", "end", "comment", "pi")
+        
+        for event, element in etree.iterwalk(body, events=events) if body is not None else []:
+            if event == "start":
+                tag = element.tag
+                if tag in heading_tags:
+                    flush_section()
+                    current_section["heading"] = "".join(t.strip() for t in element.itertext())
+                elif tag == "img":
+                    src = element.get("src")
+                    if src and src not in current_section["img_urls"]:
+                        current_section["img_urls"].append(src)
+                if tag not in NON_CONTENT_TAGS:
+                    add_text(element.text)
+            elif element is not body:
+                # Comments and processing instructions only contribute their tail
+                add_text(element.tail)
+        
         flush_section()
     
     # Final cleanup: Remove duplicate or very similar sections
     cleaned_sections = []
-    seen_texts = set()
+    seen_shingles = []
     
     for section in sections:
-        # Create a signature of the section
-        text_signature = section.text[:100].lower().strip() if section.text else ""
+        # Shingle the section so shifted or lightly edited copies still match
+        shingles = text_shingles(section.text) if section.text else frozenset()
         
         # Skip if we've seen very similar content
-        if text_signature and text_signature not in seen_texts:
-            seen_texts.add(text_signature)
+        if shingles and not is_near_duplicate(shingles, seen_shingles):
+            seen_shingles.append(shingles)
             cleaned_sections.append(section)
         elif section.heading and len(section.img_urls) > 0:
             # Keep sections with images even if text is similar
@@ -183,9 +288,8 @@ def parse_html_sections(html: str) -> List[SectionData]:
     return cleaned_sections
 
 async def persist_analysis_input(job_id: int, sections: List[SectionData], db: AsyncSession):
-    # Persist JSON to Job.analysis_input
-    data = [asdict(s) for s in sections]
-    json_str = json.dumps(data)
-    job = await db.get(Job, job_id)
-    job.analysis_input = json_str
+    # Persist JSON to Job.analysis_input; orjson serializes dataclasses natively
+    json_str = orjson.dumps(sections).decode()
+    # Single UPDATE; no need to load the Job just to set one column
+    await db.execute(update(Job).where(Job.id == job_id).values(analysis_input=json_str))
     await db.commit() 
\ No newline at end of file
@@ -3,6 +3,7 @@ Content-aware proportional sizing system for website templates.
 Calculates appropriate section heights and spacing based on actual content.
 """
 
+from bisect import bisect_right
 from typing import Dict, Any, Tuple
 import re
 
@@ -32,24 +33,22 @@ class ProportionalSizing:
         images = section_data.get('img_urls', [])
         category = section_data.get('category', 'other')
         
-        word_count = len(text.split()) if text else 0
+        # Tier thresholds top out at STANDARD_WORDS, so stop counting just past it
+        word_count = len(text.split(None, cls.STANDARD_WORDS)) if text else 0
         has_images = len(images) > 0
         has_substantial_heading = len(heading) > 5
         
-        # Content complexity scoring
-        complexity_score = cls._calculate_complexity(word_count, has_images, has_substantial_heading, category)
+        # Complexity scoring and tier selection, precomputed per word-count bucket
+        size_tier = _SIZE_TIER_TABLE[(
+            category if category in _SIZED_CATEGORIES else None,
+            bisect_right(_WORD_COUNT_EDGES, word_count),
+            has_images,
+            has_substantial_heading,
+        )]
         
-        # Determine size tier
-        size_tier = cls._determine_size_tier(complexity_score, category, word_count)
-        
-        return {
-            'section_padding': cls._get_section_padding(size_tier),
-            'container_spacing': cls._get_container_spacing(size_tier),
-            'content_spacing': cls._get_content_spacing(size_tier),
-            'size_tier': size_tier,
-            'height_class': cls._get_height_class(size_tier, category),
-            'responsive_adjustments': cls._get_responsive_adjustments(size_tier)
-        }
+        # Table entries are shared, so hand back a copy callers can mutate freely
+        sizing = _TIER_TABLE[(size_tier, category == 'hero')]
+        return {**sizing, 'responsive_adjustments': dict(sizing['responsive_adjustments'])}
     
     @classmethod 
     def _calculate_complexity(cls, word_count: int, has_images: bool, has_heading: bool, category: str) -> int:
@@ -195,49 +194,87 @@ class ProportionalSizing:
             sizing = cls.calculate_section_size(section)
             sizing_data[f'section_{section_id}'] = sizing
         
-        # Global sizing preferences
+        return {
+            'section_sizing': sizing_data,
+            'global_sizing': cls.get_global_sizing(total_sections)
+        }
+    
+    @classmethod
+    def get_global_sizing(cls, total_sections: int) -> Dict[str, Any]:
+        """Site-wide sizing preferences"""
         is_compact_site = total_sections > 5  # Sites with many sections should be more compact
         
-        global_adjustments = {
+        return {
             'is_compact_site': is_compact_site,
             'max_hero_count': 1,  # Only allow one hero section per site
             'prefer_compact_spacing': is_compact_site,
             'section_separator': 'border-t border-gray-100' if is_compact_site else ''
         }
-        
-        return {
-            'section_sizing': sizing_data,
-            'global_sizing': global_adjustments
-        }
+
+
+# Sizing classes for every (size_tier, is_hero) pair, built once from the helpers above
+_TIER_TABLE = {
+    (size_tier, is_hero): {
+        'section_padding': ProportionalSizing._get_section_padding(size_tier),
+        'container_spacing': ProportionalSizing._get_container_spacing(size_tier),
+        'content_spacing': ProportionalSizing._get_content_spacing(size_tier),
+        'size_tier': size_tier,
+        'height_class': ProportionalSizing._get_height_class(size_tier, 'hero' if is_hero else 'other'),
+        'responsive_adjustments': ProportionalSizing._get_responsive_adjustments(size_tier)
+    }
+    for size_tier in ('minimal', 'compact', 'standard', 'expanded')
+    for is_hero in (False, True)
+}
+
+
+# Word counts at which any threshold in _calculate_complexity or
+# _determine_size_tier changes outcome; bisect_right over these gives a bucket
+_WORD_COUNT_EDGES = (
+    ProportionalSizing.MINIMAL_WORDS,
+    ProportionalSizing.MINIMAL_WORDS + 1,
+    ProportionalSizing.COMPACT_WORDS,
+    ProportionalSizing.COMPACT_WORDS + 1,
+    ProportionalSizing.STANDARD_WORDS + 1,
+)
+
+# Categories with their own scoring rules; anything else sizes like None
+_SIZED_CATEGORIES = ('hero', 'contact', 'other', 'about', 'services', 'gallery')
+
+# Size tier for every (category, word-count bucket, has_images, has_heading),
+# evaluated once from the scoring rules using a representative word count per bucket
+_SIZE_TIER_TABLE = {
+    (category, bucket, has_images, has_heading): ProportionalSizing._determine_size_tier(
+        ProportionalSizing._calculate_complexity(word_count, has_images, has_heading, category),
+        category,
+        word_count,
+    )
+    for category in _SIZED_CATEGORIES + (None,)
+    for bucket, word_count in enumerate((0,) + _WORD_COUNT_EDGES)
+    for has_images in (False, True)
+    for has_heading in (False, True)
+}
 
 
 def apply_proportional_sizing_to_sections(sections: list) -> list:
     """Apply proportional sizing to section data"""
     
-    sizing_context = ProportionalSizing.get_template_sizing_context(sections)
-    
-    # Update each section with sizing information
-    for section in sections:
-        section_id = section.get('section_id', 0)
-        sizing_key = f'section_{section_id}'
-        
-        if sizing_key in sizing_context['section_sizing']:
-            sizing_info = sizing_context['section_sizing'][sizing_key]
-            
-            # Add sizing properties to section
-            section['sizing'] = sizing_info
-            section['is_compact_site'] = sizing_context['global_sizing']['is_compact_site']
+    global_sizing = ProportionalSizing.get_global_sizing(len(sections))
+    is_compact_site = global_sizing['is_compact_site']
     
     # Limit hero sections to prevent multiple full-height sections
     hero_count = 0
-    max_heroes = sizing_context['global_sizing']['max_hero_count']
+    max_heroes = global_sizing['max_hero_count']
     
+    # One pass: size each section from its original category, then demote excess heroes
     for section in sections:
+        section['sizing'] = ProportionalSizing.calculate_section_size(section)
+        section['is_compact_site'] = is_compact_site
+        
         if section.get('category') == 'hero':
             hero_count += 1
             if hero_count > max_heroes:
                 # Convert excess heroes to 'about' or 'other'
-                if len(section.get('original_text', '').split()) > 100:
+                if len(section.get('original_text', '').split(None, 100)) > 100:
                     section['category'] = 'about'
                 else:
                     section['category'] = 'other'
@@ -1,11 +1,20 @@
+import asyncio
+import io
+import json
 import os
-import shutil
 import tempfile
+import threading
 import zipfile
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, select_autoescape
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from app.models import Job
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from .typography import create_typography_system
@@ -15,6 +24,36 @@ from .proportional_sizing import apply_proportional_sizing_to_sections
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '../templates')
 
+TEMPLATE_AUTOESCAPE = select_autoescape(['html', 'xml'])
+
+# Compiled template bytecode persists on disk so fresh workers skip codegen;
+# entries are keyed on the template source, so edits invalidate them
+os.makedirs(settings.JINJA_CACHE_DIR, exist_ok=True)
+
+
+def get_template_loader():
+    """Load templates from the precompiled archive when one is configured"""
+    archive = settings.JINJA_PRECOMPILED_TEMPLATES
+    if archive and os.path.exists(archive):
+        return ModuleLoader(archive)
+    return FileSystemLoader(TEMPLATES_DIR)
+
+
+def precompile_templates(target: str) -> None:
+    """Compile every template into a zip archive usable by ModuleLoader"""
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=TEMPLATE_AUTOESCAPE)
+    env.compile_templates(target, zip='deflated', ignore_errors=False)
+
+
+# Shared environment so compiled templates are cached across renders;
+# only re-check template mtimes while developing
+TEMPLATE_ENV = Environment(
+    loader=get_template_loader(),
+    autoescape=TEMPLATE_AUTOESCAPE,
+    auto_reload=settings.ENV == "development",
+    bytecode_cache=FileSystemBytecodeCache(settings.JINJA_CACHE_DIR),
+)
+
 CATEGORY_BLOCKS = {
     'hero': 'blocks/hero_modern.html',
     'about': 'blocks/about_responsive.html', 
@@ -29,7 +68,27 @@ CATEGORY_BLOCKS = {
     'contact_mixed': 'blocks/mixed_responsive.html',
 }
 
-def prepare_section_for_rendering(section: Dict[str, Any], brand_identity: Dict[str, Any] = None, typography = None) -> Dict[str, Any]:
+# Site bundles are usually small; only go multipart for unusually large ones
+ZIP_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=4)
+
+# Already-compressed formats gain nothing from DEFLATE, so they are stored as-is
+PRECOMPRESSED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.avif', '.mp4', '.webm', '.woff', '.woff2', '.zip')
+
+# Image URLs with these prefixes are fetched by the browser, never bundled
+REMOTE_URL_PREFIXES = ('http://', 'https://', '//', 'data:')
+
+# Upper bound on threads reading bundle assets concurrently
+ASSET_READ_WORKERS = 8
+
+
+def zip_compression_for(filename: str) -> int:
+    """Pick the zip compression type for a bundle entry"""
+    if filename.lower().endswith(PRECOMPRESSED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+def prepare_section_for_rendering(section: Dict[str, Any], brand_identity: Dict[str, Any] = None, typography = None,
+                                  typography_context: Dict[str, Any] = None) -> Dict[str, Any]:
     """Prepare section data for template rendering with enhanced context"""
     
     # Extract business data for template context
@@ -69,7 +128,6 @@ def prepare_section_for_rendering(section: Dict[str, Any], brand_identity: Dict[
     # Add image_set with safe defaults if not provided via brand_identity
     if brand_identity:
         try:
-            from .image_processing import process_section_images
             image_set = process_section_images(section, brand_identity)
             template_context['image_set'] = {
                 'primary_image': image_set.primary_image,
@@ -85,129 +143,196 @@ def prepare_section_for_rendering(section: Dict[str, Any], brand_identity: Dict[
         # Provide safe defaults when brand_identity not available
         template_context['image_set'] = create_default_image_set()
     
-    # Add typography with safe defaults if not provided
+    # Typography is the same for every section, so callers rendering many
+    # sections build it once and pass it in
+    if typography_context is None:
+        typography_context = build_typography_context(typography)
+    template_context['typography'] = typography_context
+    
+    return template_context
+
+
+def build_typography_context(typography = None) -> Dict[str, Any]:
+    """Build the per-section typography context with safe defaults"""
     if typography:
         try:
-            template_context['typography'] = {
+            return {
                 'primary_font': typography.primary_font,
                 'heading_font': typography.heading_font,
                 'semantic_styles': typography.get_semantic_text_styles() if hasattr(typography, 'get_semantic_text_styles') else {},
             }
         except Exception as e:
             # Fallback to safe defaults if typography fails
-            template_context['typography'] = create_default_typography()
-    else:
-        # Provide safe defaults when typography not available
-        template_context['typography'] = create_default_typography()
-    
-    return template_context
+            return create_default_typography()
+    # Provide safe defaults when typography not available
+    return create_default_typography()
 
 
-def create_default_image_set() -> Dict[str, Any]:
-    """Create safe default image_set to prevent template errors"""
-    return {
-        'primary_image': None,
-        'all_images': [],
-        'hero_images': [],
-        'gallery_images': [],
-        'icon_images': [],
-    }
+# Defaults built once and shared by every section that falls back to them, as
+# the typography context is; templates only read them, and the read-only
+# views and tuples make any accidental write fail instead of leaking
+DEFAULT_IMAGE_SET = MappingProxyType({
+    'primary_image': None,
+    'all_images': (),
+    'hero_images': (),
+    'gallery_images': (),
+    'icon_images': (),
+})
 
+DEFAULT_TYPOGRAPHY = MappingProxyType({
+    'primary_font': 'Inter, system-ui, sans-serif',
+    'heading_font': 'Inter, system-ui, sans-serif',
+    'semantic_styles': MappingProxyType({}),
+})
 
-def create_default_typography() -> Dict[str, Any]:
-    """Create safe default typography to prevent template errors"""
-    return {
-        'primary_font': 'Inter, system-ui, sans-serif',
-        'heading_font': 'Inter, system-ui, sans-serif',
-        'semantic_styles': {},
-    }
 
-def render_site(sections: List[Dict[str, Any]], title: str = None) -> str:
-    env = Environment(
-        loader=FileSystemLoader(TEMPLATES_DIR),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
+def create_default_image_set() -> Mapping[str, Any]:
+    """Return the safe default image_set to prevent template errors"""
+    return DEFAULT_IMAGE_SET
+
+
+def create_default_typography() -> Mapping[str, Any]:
+    """Return the safe default typography to prevent template errors"""
+    return DEFAULT_TYPOGRAPHY
+
+
+def read_asset(arcname: str):
+    """Read a bundled asset from the templates dir, returning (ZipInfo, bytes) or None"""
+    asset_src = os.path.join(TEMPLATES_DIR, arcname)
+    # Just try to open it: missing files and directories fail here, with no
+    # separate existence check to stat first or race against
+    try:
+        with open(asset_src, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # ZipInfo.from_file keeps the asset's mtime and permissions, as zipf.write would
+    return zipfile.ZipInfo.from_file(asset_src, arcname), data
+
+
+def build_site_zip(html: str, img_urls: Iterable[str]) -> bytes:
+    """Bundle index.html and locally referenced assets into an in-memory zip"""
+    # Collect referenced assets that live in the templates dir
+    arcnames = []
+    written = {'index.html'}
+    for img in img_urls:
+        if not img or img.startswith(REMOTE_URL_PREFIXES):
+            continue
+        arcname = os.path.normpath(img.lstrip('/'))
+        # Never let an asset escape the bundle root or clobber the page
+        if arcname in written or arcname.startswith('..'):
+            continue
+        written.add(arcname)
+        arcnames.append(arcname)
+    
+    # Reads are latency-bound on mounted template dirs, so overlap them;
+    # the zip itself is written sequentially below
+    if len(arcnames) > 1:
+        with ThreadPoolExecutor(max_workers=min(ASSET_READ_WORKERS, len(arcnames))) as pool:
+            assets = list(pool.map(read_asset, arcnames))
+    else:
+        assets = [read_asset(arcname) for arcname in arcnames]
     
+    buf = io.BytesIO()
+    # Fastest DEFLATE level: bundles are small, so level 6 only burns CPU
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        zipf.writestr('index.html', html)
+        for arcname, asset in zip(arcnames, assets):
+            if asset is not None:
+                zinfo, data = asset
+                zipf.writestr(zinfo, data, compress_type=zip_compression_for(arcname),
+                              compresslevel=zipf.compresslevel)
+    return buf.getvalue()
+
+
+def render_site_bytes(sections: List[Dict[str, Any]], title: str = None) -> bytes:
+    """Render the basic site and return the zipped bundle as bytes"""
     # Prepare sections for rendering with enhanced context
     enhanced_sections = []
     for section in sections:
         enhanced_section = prepare_section_for_rendering(section)
         enhanced_sections.append(enhanced_section)
     
-    template = env.get_template('index.html')
+    template = TEMPLATE_ENV.get_template('index.html')
     html = template.render(sections=enhanced_sections, title=title)
-    # Create temp dir for site bundle
-    temp_dir = tempfile.mkdtemp()
-    # Write index.html
-    index_path = os.path.join(temp_dir, 'index.html')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    # Copy referenced assets (img_urls)
-    asset_paths = set()
-    for section in sections:
-        for img in section.get('img_urls', []):
-            if img and not img.startswith('http'):
-                asset_paths.add(img)
-    for asset in asset_paths:
-        asset_src = os.path.join(TEMPLATES_DIR, asset.lstrip('/'))
-        asset_dst = os.path.join(temp_dir, asset.lstrip('/'))
-        os.makedirs(os.path.dirname(asset_dst), exist_ok=True)
-        if os.path.exists(asset_src):
-            shutil.copy(asset_src, asset_dst)
-    # Zip the site
-    zip_path = os.path.join(temp_dir, 'site.zip')
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(temp_dir):
-            for file in files:
-                if file == 'site.zip':
-                    continue
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, temp_dir)
-                zipf.write(abs_path, rel_path)
+    return build_site_zip(html, (img for section in sections for img in section.get('img_urls', [])))
+
+
+def render_site(sections: List[Dict[str, Any]], title: str = None) -> str:
+    """Render the basic site and write the zip to a temp file, returning its path"""
+    fd, zip_path = tempfile.mkstemp(suffix='.zip')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(render_site_bytes(sections, title))
     return zip_path
 
 
-def render_site_with_brand(sections: List[Dict[str, Any]], brand_identity: Dict[str, Any], title: str = None) -> str:
-    """Enhanced render function with brand identity, typography, and image processing"""
-    
-    env = Environment(
-        loader=FileSystemLoader(TEMPLATES_DIR),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
-    
+def build_brand_styles(brand_identity: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the typography system and all brand-derived CSS for a brand identity"""
     # Create typography system from brand identity
     typography = create_typography_system(brand_identity)
     
-    # Generate dynamic CSS based on brand identity
-    brand_css = generate_brand_css(brand_identity, typography)
+    return {
+        'typography': typography,
+        # Generate dynamic CSS based on brand identity
+        'brand_css': generate_brand_css(brand_identity, typography),
+        'typography_context': build_typography_context(typography),
+        'page_typography': {
+            'css': typography.get_typography_css(),
+            'responsive_css': typography.apply_responsive_scaling(),
+            'font_imports': typography.get_font_imports(),
+            'primary_font': typography.primary_font,
+            'heading_font': typography.heading_font,
+        },
+    }
+
+
+@lru_cache(maxsize=128)
+def _cached_brand_styles(brand_key: str) -> Dict[str, Any]:
+    return build_brand_styles(json.loads(brand_key))
+
+
+def get_brand_styles(brand_identity: Dict[str, Any]) -> Dict[str, Any]:
+    """Brand styles for a brand identity, reused across jobs rendering the same brand"""
+    try:
+        brand_key = json.dumps(brand_identity, sort_keys=True)
+    except TypeError:
+        # Not plain JSON data, so there is no stable key to cache on
+        return build_brand_styles(brand_identity)
+    return _cached_brand_styles(brand_key)
+
+
+def render_site_with_brand_bytes(sections: List[Dict[str, Any]], brand_identity: Dict[str, Any], title: str = None) -> bytes:
+    """Enhanced render function with brand identity, typography, and image processing"""
+    
+    # Typography system, brand CSS and typography contexts for this brand
+    brand_styles = get_brand_styles(brand_identity)
+    typography = brand_styles['typography']
     
     # Apply proportional sizing to all sections
     sections_with_sizing = apply_proportional_sizing_to_sections(sections)
     
     # Process sections with enhanced context including images and typography
+    # and aggregate business data and bundle assets from all sections
+    typography_context = brand_styles['typography_context']
     enhanced_sections = []
+    # Insertion-ordered dicts double as ordered sets, deduplicating as we go
+    all_phones = {}
+    all_emails = {}
+    img_urls = []
     for section in sections_with_sizing:
-        # Prepare section with all enhancements including image_set and typography
-        enhanced_section = prepare_section_for_rendering(section, brand_identity, typography)
-        enhanced_sections.append(enhanced_section)
-    
-    # Aggregate business data from all sections for global template context
-    all_phones = []
-    all_emails = []
-    for section in sections:
+        enhanced_sections.append(
+            prepare_section_for_rendering(section, brand_identity, typography, typography_context=typography_context)
+        )
         business_data = section.get('business_data', {})
-        phones = business_data.get('phones', [])
-        emails = business_data.get('emails', [])
-        all_phones.extend(phones)
-        all_emails.extend(emails)
-    
-    # Remove duplicates while preserving order
-    all_phones = list(dict.fromkeys(all_phones))
-    all_emails = list(dict.fromkeys(all_emails))
+        for phone in business_data.get('phones', []):
+            all_phones[phone] = None
+        for email in business_data.get('emails', []):
+            all_emails[email] = None
+        img_urls.extend(section.get('img_urls', []))
     
     aggregated_business_data = {
-        'phones': all_phones,
-        'emails': all_emails
+        'phones': list(all_phones),
+        'emails': list(all_emails)
     }
     
     # Create template context with brand identity and CSS
@@ -216,77 +341,90 @@ def render_site_with_brand(sections: List[Dict[str, Any]], brand_identity: Dict[
         'title': title or 'Modern Professional Website',
         'brand_identity': brand_identity,
         'business_data': aggregated_business_data,  # Add aggregated business data
-        'typography': {
-            'css': typography.get_typography_css(),
-            'responsive_css': typography.apply_responsive_scaling(),
-            'font_imports': typography.get_font_imports(),
-            'primary_font': typography.primary_font,
-            'heading_font': typography.heading_font,
-        },
-        'brand_css': brand_css,  # Dynamic CSS system
+        'typography': brand_styles['page_typography'],
+        'brand_css': brand_styles['brand_css'],  # Dynamic CSS system
     }
     
     # Render with modern enhanced template
-    template = env.get_template('index_modern.html')
+    template = TEMPLATE_ENV.get_template('index_modern.html')
     html = template.render(**template_context)
-    
-    # Create temp dir for site bundle
-    temp_dir = tempfile.mkdtemp()
-    
-    # Write index.html
-    index_path = os.path.join(temp_dir, 'index.html')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    # Copy referenced assets (keeping existing logic)
-    asset_paths = set()
-    for section in sections:
-        for img in section.get('img_urls', []):
-            if img and not img.startswith('http'):
-                asset_paths.add(img)
-    
-    for asset in asset_paths:
-        asset_src = os.path.join(TEMPLATES_DIR, asset.lstrip('/'))
-        asset_dst = os.path.join(temp_dir, asset.lstrip('/'))
-        os.makedirs(os.path.dirname(asset_dst), exist_ok=True)
-        if os.path.exists(asset_src):
-            shutil.copy(asset_src, asset_dst)
-    
-    # Zip the site
-    zip_path = os.path.join(temp_dir, 'site.zip')
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(temp_dir):
-            for file in files:
-                if file == 'site.zip':
-                    continue
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, temp_dir)
-                zipf.write(abs_path, rel_path)
-    
+    return build_site_zip(html, img_urls)
+
+
+def render_site_with_brand(sections: List[Dict[str, Any]], brand_identity: Dict[str, Any], title: str = None) -> str:
+    """Render the branded site and write the zip to a temp file, returning its path"""
+    fd, zip_path = tempfile.mkstemp(suffix='.zip')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(render_site_with_brand_bytes(sections, brand_identity, title))
     return zip_path
 
 
-async def upload_and_set_output(job_id: int, zip_path: str, db: AsyncSession):
-    minio_endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000")
-    minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
-    minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
-    minio_bucket = os.getenv("MINIO_BUCKET", "pagelift-assets")
-    
-    # Fix endpoint URL construction - don't add http:// if already present
-    if not minio_endpoint.startswith(('http://', 'https://')):
-        minio_endpoint = f"http://{minio_endpoint}"
-    
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=minio_endpoint,
-        aws_access_key_id=minio_access_key,
-        aws_secret_access_key=minio_secret_key,
-        region_name="us-east-1",
-    )
+# MinIO settings are read once at import
+MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "localhost:9000")
+MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
+MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
+MINIO_BUCKET = os.getenv("MINIO_BUCKET", "pagelift-assets")
+
+_S3 = None
+_S3_LOCK = threading.Lock()
+
+
+def get_s3_client():
+    """Return the shared MinIO client, creating it on first use"""
+    global _S3
+    if _S3 is None:
+        with _S3_LOCK:
+            if _S3 is None:
+                # Fix endpoint URL construction - don't add http:// if already present
+                minio_endpoint = MINIO_ENDPOINT
+                if not minio_endpoint.startswith(('http://', 'https://')):
+                    minio_endpoint = f"http://{minio_endpoint}"
+                
+                _S3 = boto3.client(
+                    "s3",
+                    endpoint_url=minio_endpoint,
+                    aws_access_key_id=MINIO_ACCESS_KEY,
+                    aws_secret_access_key=MINIO_SECRET_KEY,
+                    region_name="us-east-1",
+                    config=BotoConfig(
+                        max_pool_connections=50,
+                        retries={'max_attempts': 3, 'mode': 'adaptive'},
+                    ),
+                )
+    return _S3
+
+
+def upload_site_zip(job_id: int, zip_bytes: bytes) -> str:
+    """Stream a site bundle from memory to MinIO, returning its object key"""
+    s3 = get_s3_client()
     key = f"S3_GENERATED/site_{job_id}.zip"
-    with open(zip_path, 'rb') as f:
-        s3.put_object(Bucket=minio_bucket, Key=key, Body=f)
+    s3.upload_fileobj(
+        io.BytesIO(zip_bytes),
+        MINIO_BUCKET,
+        key,
+        ExtraArgs={
+            'ContentType': 'application/zip',
+            'ContentDisposition': f'attachment; filename="site_{job_id}.zip"',
+        },
+        Config=ZIP_TRANSFER_CONFIG,
+    )
+    return key
+
+
+async def upload_and_set_output(job_id: int, zip_bytes: bytes, db: AsyncSession):
+    # boto3 blocks, so upload on a worker thread to keep the event loop free
+    key = await asyncio.to_thread(upload_site_zip, job_id, zip_bytes)
     # Set Job.output_zip_url
-    job = await db.get(Job, job_id)
-    job.output_zip_url = key
-    await db.commit() 
\ No newline at end of file
+    await db.execute(update(Job).where(Job.id == job_id).values(output_zip_url=key))
+    await db.commit()
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Site rendering utilities")
+    parser.add_argument("--precompile", metavar="TARGET", required=True,
+                        help="write precompiled templates to this zip archive")
+    args = parser.parse_args()
+    precompile_templates(args.precompile)
+    print(f"Precompiled templates written to {args.precompile}")
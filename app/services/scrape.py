@@ -1,14 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-import boto3
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, ParserRejectedMarkup
+from urllib.parse import urljoin, urlparse, urlsplit
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+import gzip
 import re
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from requests.exceptions import HTTPError
 from .brand_extraction import extract_brand_identity
+from .render import get_s3_client, MINIO_BUCKET
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -18,53 +25,49 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     html: str
     tag: str
     classes: List[str]
     id: Optional[str]
     text: Optional[str] = None
-    forms: List[Dict[str, Any]] = None
-    ctas: List[Dict[str, Any]] = None
-    business_data: Dict[str, Any] = None
+    forms: List[Dict[str, Any]] = field(default_factory=list)
+    ctas: List[Dict[str, Any]] = field(default_factory=list)
+    business_data: Dict[str, Any] = field(default_factory=dict)
     section_id: Optional[int] = None
     heading: Optional[str] = None
-    img_urls: List[str] = None
+    img_urls: List[str] = field(default_factory=list)
     strategy: Optional[str] = None
     priority: Optional[int] = None
-    
-    def __post_init__(self):
-        if self.forms is None:
-            self.forms = []
-        if self.ctas is None:
-            self.ctas = []
-        if self.business_data is None:
-            self.business_data = {}
-        if self.img_urls is None:
-            self.img_urls = []
 
-@dataclass
+@dataclass(slots=True)
 class PageScrape:
     url: str
     html: str
     assets: List[str]
     sections: List[Section]
     brand_identity: Optional[Dict[str, Any]] = None  # Brand identity data
-    business_info: Dict[str, Any] = None
-    navigation: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.business_info is None:
-            self.business_info = {}
-        if self.navigation is None:
-            self.navigation = {}
+    business_info: Dict[str, Any] = field(default_factory=dict)
+    navigation: Dict[str, Any] = field(default_factory=dict)
 
 @dataclass
 class MultiPageScrapeResult:
     pages: List[PageScrape]
 
 
+def _parse(html_str):
+    # html_str is already decoded text, so there is no encoding for bs4 to sniff
+    try:
+        return BeautifulSoup(html_str, "lxml")
+    except ParserRejectedMarkup:
+        # libxml2 gives up on some badly broken markup; the pure-Python parser copes
+        return BeautifulSoup(html_str, "html.parser")
+
+
+HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
+
 def extract_text_content(element):
     """Extract clean text content from an element, preserving structure"""
     if not element:
@@ -86,22 +89,51 @@ def extract_text_content(element):
 def extract_heading_hierarchy(soup):
     """Extract all headings with their hierarchy"""
     headings = []
-    for level in range(1, 7):  # h1 to h6
-        for heading in soup.find_all(f"h{level}"):
-            headings.append({
-                'level': level,
-                'text': heading.get_text().strip(),
-                'element': heading
-            })
+    # One walk for all levels; the stable sort keeps document order within a level
+    for heading in sorted(soup.find_all(HEADING_TAGS), key=lambda h: int(h.name[1])):
+        headings.append({
+            'level': int(heading.name[1]),
+            'text': heading.get_text().strip(),
+            'element': heading
+        })
     return headings
 
-def find_content_containers(soup):
-    """Find all potential content containers using multiple strategies"""
+# Class/id substrings that mark a block as a likely content container
+SEMANTIC_KEYWORDS = [
+    'hero', 'banner', 'intro', 'about', 'services', 'products', 'gallery', 
+    'portfolio', 'testimonials', 'reviews', 'contact', 'footer', 'header',
+    'content', 'main', 'primary', 'secondary', 'sidebar', 'widget',
+    'section', 'block', 'container', 'wrapper', 'area', 'zone'
+]
+_SEMANTIC_KEYWORD_RE = re.compile("|".join(map(re.escape, SEMANTIC_KEYWORDS)))
+
+def find_content_containers(soup, texts=None):
+    """Find all potential content containers using multiple strategies
+    
+    If texts is given, the cleaned text of every element whose text was measured
+    is stored in it, keyed on id(element), so callers needn't extract it again.
+    """
     containers = []
     
+    # Collect every candidate element in one walk, bucketed per strategy in
+    # document order, instead of walking the tree again for each tag list
+    semantic_tags = ["section", "article", "header", "footer", "main", "aside", "nav"]
+    by_semantic_tag = {tag: [] for tag in semantic_tags}
+    blocks = []  # div, section and article
+    text_blocks = []  # blocks plus paragraphs
+    for el in soup.find_all(semantic_tags + ['div', 'p']):
+        name = el.name
+        if name in by_semantic_tag:
+            by_semantic_tag[name].append(el)
+        if name in ('div', 'section', 'article'):
+            blocks.append(el)
+            text_blocks.append(el)
+        elif name == 'p':
+            text_blocks.append(el)
+    
     # Strategy 1: Semantic HTML5 elements
-    for tag in ["section", "article", "header", "footer", "main", "aside", "nav"]:
-        for el in soup.find_all(tag):
+    for tag in semantic_tags:
+        for el in by_semantic_tag[tag]:
             containers.append({
                 'element': el,
                 'strategy': 'semantic',
@@ -110,19 +142,12 @@ def find_content_containers(soup):
             })
     
     # Strategy 2: Divs with meaningful class names or IDs
-    semantic_keywords = [
-        'hero', 'banner', 'intro', 'about', 'services', 'products', 'gallery', 
-        'portfolio', 'testimonials', 'reviews', 'contact', 'footer', 'header',
-        'content', 'main', 'primary', 'secondary', 'sidebar', 'widget',
-        'section', 'block', 'container', 'wrapper', 'area', 'zone'
-    ]
-    
-    for div in soup.find_all(['div', 'section', 'article']):
+    for div in blocks:
         classes = ' '.join(div.get("class", [])).lower()
         div_id = (div.get("id") or "").lower()
         
         # Check if classes or ID contain semantic keywords
-        if any(keyword in classes or keyword in div_id for keyword in semantic_keywords):
+        if _SEMANTIC_KEYWORD_RE.search(classes) or _SEMANTIC_KEYWORD_RE.search(div_id):
             containers.append({
                 'element': div,
                 'strategy': 'semantic_classes',
@@ -131,8 +156,10 @@ def find_content_containers(soup):
             })
     
     # Strategy 3: Content-rich containers (substantial text content)
-    for div in soup.find_all(['div', 'section', 'article', 'p']):
+    for div in text_blocks:
         text_content = extract_text_content(div)
+        if texts is not None:
+            texts[id(div)] = text_content
         word_count = len(text_content.split())
         
         # If container has significant text content (20+ words)
@@ -146,7 +173,7 @@ def find_content_containers(soup):
             })
     
     # Strategy 4: Containers with images
-    for container in soup.find_all(['div', 'section', 'article']):
+    for container in blocks:
         images = container.find_all('img')
         if images:
             containers.append({
@@ -161,39 +188,62 @@ def find_content_containers(soup):
 
 def deduplicate_containers(containers):
     """Remove duplicate containers, keeping the most specific ones"""
-    seen_elements = set()
+    # Elements already added, grouped by text: identical markup implies identical
+    # text, so markup only has to be serialized and compared when texts collide
+    seen_by_text = {}
+    markup = {}
     unique_containers = []
+    # Nesting is decided by identity: ids of every kept element, and for each kept
+    # container the ids of its ancestors, so no check has to walk a subtree
+    kept_ids = set()
     
     # Sort by priority (lower number = higher priority)
     containers.sort(key=lambda x: x['priority'])
     
     for container in containers:
         element = container['element']
-        element_html = str(element)
+        element_id = id(element)
+        ancestor_ids = {id(parent) for parent in element.parents}
         
-        # Skip if we've already seen this exact element
-        if element_html in seen_elements:
+        # Skip if this element was already added, or sits inside an element we've already added
+        if element_id in kept_ids or not kept_ids.isdisjoint(ancestor_ids):
             continue
-            
-        # Skip if this element is contained within another element we've already added
-        is_duplicate = False
+        
+        # Skip if we've already added an element with this exact markup
+        same_text = seen_by_text.setdefault(element.get_text(), [])
+        if same_text:
+            for other in same_text + [element]:
+                if id(other) not in markup:
+                    markup[id(other)] = str(other)
+            if any(markup[id(other)] == markup[element_id] for other in same_text):
+                continue
+        
+        # Check if an existing element is inside current element (replace existing with current)
         for existing in unique_containers:
-            existing_element = existing['element']
-            # Check if current element is inside existing element
-            if element in existing_element.descendants:
-                is_duplicate = True
-                break
-            # Check if existing element is inside current element (replace existing with current)
-            elif existing_element in element.descendants:
+            if element_id in existing['ancestor_ids']:
                 unique_containers.remove(existing)
+                kept_ids.discard(id(existing['element']))
                 break
         
-        if not is_duplicate:
-            seen_elements.add(element_html)
-            unique_containers.append(container)
+        same_text.append(element)
+        kept_ids.add(element_id)
+        container['ancestor_ids'] = ancestor_ids
+        unique_containers.append(container)
     
     return unique_containers
 
+# Pages of one site share most of their links and images, so URL resolution is memoized
+@lru_cache(maxsize=8192)
+def _join(base, url):
+    return urljoin(base, url)
+
+
+@lru_cache(maxsize=8192)
+def _netloc(url):
+    # urlsplit gives the same netloc as urlparse without splitting params
+    return urlsplit(url).netloc
+
+
 def extract_images_from_element(element, base_url):
     """Extract all images from an element"""
     images = []
@@ -205,38 +255,43 @@ def extract_images_from_element(element, base_url):
             if src.startswith('//'):
                 src = 'https:' + src
             elif src.startswith('/'):
-                from urllib.parse import urljoin
-                src = urljoin(base_url, src)
+                src = _join(base_url, src)
             elif not src.startswith(('http://', 'https://')):
-                from urllib.parse import urljoin
-                src = urljoin(base_url, src)
+                src = _join(base_url, src)
             images.append(src)
     return images
 
+# Phone number patterns, compiled once rather than on every page
+_PHONE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Portuguese phone numbers
+    r'(\+351\s?)?(\d{3}\s?\d{3}\s?\d{3})',
+    r'(\+351\s?)?(91\d{7}|92\d{7}|93\d{7}|96\d{7})',
+    
+    # General international patterns
+    r'\+?[\d\s\-\(\)]{10,15}',
+    r'\(\d{3}\)\s?\d{3}[\-\s]?\d{4}',
+    r'\d{3}[\-\.\s]?\d{3}[\-\.\s]?\d{4}',
+    
+    # UK patterns
+    r'\+44\s?\d{10,11}',
+    r'0\d{10}',
+    
+    # US patterns
+    r'\+1\s?\d{10}',
+    r'\d{3}[\-\.\s]?\d{4}',
+)]
+_PHONE_CLEAN_RE = re.compile(r'[^\d\+]')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+# Every phone, hours and address pattern needs at least one digit
+_DIGIT_RE = re.compile(r'\d')
+
 def extract_phone_numbers(text):
     """Extract phone numbers using various international patterns"""
-    phone_patterns = [
-        # Portuguese phone numbers
-        r'(\+351\s?)?(\d{3}\s?\d{3}\s?\d{3})',
-        r'(\+351\s?)?(91\d{7}|92\d{7}|93\d{7}|96\d{7})',
-        
-        # General international patterns
-        r'\+?[\d\s\-\(\)]{10,15}',
-        r'\(\d{3}\)\s?\d{3}[\-\s]?\d{4}',
-        r'\d{3}[\-\.\s]?\d{3}[\-\.\s]?\d{4}',
-        
-        # UK patterns
-        r'\+44\s?\d{10,11}',
-        r'0\d{10}',
-        
-        # US patterns
-        r'\+1\s?\d{10}',
-        r'\d{3}[\-\.\s]?\d{4}',
-    ]
-    
     phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    if not _DIGIT_RE.search(text):
+        return phones
+    for pattern in _PHONE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if isinstance(match, tuple):
                 phone = ''.join(match).strip()
@@ -244,18 +299,19 @@ def extract_phone_numbers(text):
                 phone = match.strip()
             
             # Clean up the phone number
-            phone = re.sub(r'[^\d\+]', '', phone)
+            phone = _PHONE_CLEAN_RE.sub('', phone)
             
             # Validate length (7-15 digits)
-            if 7 <= len(re.sub(r'[^\d]', '', phone)) <= 15:
+            if 7 <= len(_NON_DIGIT_RE.sub('', phone)) <= 15:
                 phones.append(phone)
     
     return list(set(phones))  # Remove duplicates
 
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
+
 def extract_email_addresses(text):
     """Extract email addresses"""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text, re.IGNORECASE)
+    emails = _EMAIL_RE.findall(text)
     
     # Filter out obvious noise
     valid_emails = []
@@ -266,127 +322,153 @@ def extract_email_addresses(text):
     
     return list(set(valid_emails))
 
+_HOURS_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Portuguese patterns
+    r'(segunda|terça|quarta|quinta|sexta|sábado|domingo).{0,20}(\d{1,2}[h:]?\d{0,2}).{0,10}(\d{1,2}[h:]?\d{0,2})',
+    r'(seg|ter|qua|qui|sex|sáb|dom).{0,20}(\d{1,2}[h:]?\d{0,2}).{0,10}(\d{1,2}[h:]?\d{0,2})',
+    
+    # English patterns
+    r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday).{0,20}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?)',
+    r'(mon|tue|wed|thu|fri|sat|sun).{0,20}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?)',
+    
+    # General time patterns
+    r'(\d{1,2}[h:]\d{2}).{0,5}(\d{1,2}[h:]\d{2})',
+    r'(\d{1,2}[:\.]?\d{0,2}\s?[ap]m).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m)',
+)]
+
 def extract_business_hours(text):
     """Extract business hours information"""
-    hours_patterns = [
-        # Portuguese patterns
-        r'(segunda|terça|quarta|quinta|sexta|sábado|domingo).{0,20}(\d{1,2}[h:]?\d{0,2}).{0,10}(\d{1,2}[h:]?\d{0,2})',
-        r'(seg|ter|qua|qui|sex|sáb|dom).{0,20}(\d{1,2}[h:]?\d{0,2}).{0,10}(\d{1,2}[h:]?\d{0,2})',
-        
-        # English patterns
-        r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday).{0,20}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?)',
-        r'(mon|tue|wed|thu|fri|sat|sun).{0,20}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m?)',
-        
-        # General time patterns
-        r'(\d{1,2}[h:]\d{2}).{0,5}(\d{1,2}[h:]\d{2})',
-        r'(\d{1,2}[:\.]?\d{0,2}\s?[ap]m).{0,10}(\d{1,2}[:\.]?\d{0,2}\s?[ap]m)',
-    ]
-    
     hours_info = []
-    for pattern in hours_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    if not _DIGIT_RE.search(text):
+        return hours_info
+    for pattern in _HOURS_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             hours_info.append(' '.join(match))
     
     return hours_info
 
+_ADDRESS_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Portuguese address patterns
+    r'(rua|avenida|av\.|r\.|travessa|praça|largo)\s+[A-Za-zÀ-ÿ\s\d\-,\.]+\d{4}[\-\s]?\d{3}',
+    r'\d{4}[\-\s]?\d{3}\s+[A-Za-zÀ-ÿ\s]+',
+    
+    # General address patterns
+    r'\d+\s+[A-Za-z\s]+\b(street|st|avenue|ave|road|rd|drive|dr|lane|ln|way|place|pl)\b',
+    r'\b\d{1,5}\s+[A-Za-z\s]+,\s*[A-Za-z\s]+,?\s*\d{5}',
+)]
+
 def extract_addresses(text):
     """Extract address information"""
-    address_patterns = [
-        # Portuguese address patterns
-        r'(rua|avenida|av\.|r\.|travessa|praça|largo)\s+[A-Za-zÀ-ÿ\s\d\-,\.]+\d{4}[\-\s]?\d{3}',
-        r'\d{4}[\-\s]?\d{3}\s+[A-Za-zÀ-ÿ\s]+',
-        
-        # General address patterns
-        r'\d+\s+[A-Za-z\s]+\b(street|st|avenue|ave|road|rd|drive|dr|lane|ln|way|place|pl)\b',
-        r'\b\d{1,5}\s+[A-Za-z\s]+,\s*[A-Za-z\s]+,?\s*\d{5}',
-    ]
-    
     addresses = []
-    for pattern in address_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    if not _DIGIT_RE.search(text):
+        return addresses
+    for pattern in _ADDRESS_PATTERNS:
+        matches = pattern.findall(text)
         addresses.extend(matches)
     
     return addresses
 
-def extract_social_media_links(soup):
-    """Extract social media profile links"""
-    social_patterns = {
-        'facebook': r'(?:https?://)?(?:www\.)?facebook\.com/[A-Za-z0-9._-]+',
-        'instagram': r'(?:https?://)?(?:www\.)?instagram\.com/[A-Za-z0-9._-]+',
-        'twitter': r'(?:https?://)?(?:www\.)?twitter\.com/[A-Za-z0-9._-]+',
-        'linkedin': r'(?:https?://)?(?:www\.)?linkedin\.com/(?:in|company)/[A-Za-z0-9._-]+',
-        'youtube': r'(?:https?://)?(?:www\.)?youtube\.com/(?:c|channel|user)/[A-Za-z0-9._-]+',
-    }
+_SOCIAL_PATTERNS = {platform: re.compile(pattern, re.IGNORECASE) for platform, pattern in {
+    'facebook': r'(?:https?://)?(?:www\.)?facebook\.com/[A-Za-z0-9._-]+',
+    'instagram': r'(?:https?://)?(?:www\.)?instagram\.com/[A-Za-z0-9._-]+',
+    'twitter': r'(?:https?://)?(?:www\.)?twitter\.com/[A-Za-z0-9._-]+',
+    'linkedin': r'(?:https?://)?(?:www\.)?linkedin\.com/(?:in|company)/[A-Za-z0-9._-]+',
+    'youtube': r'(?:https?://)?(?:www\.)?youtube\.com/(?:c|channel|user)/[A-Za-z0-9._-]+',
+}.items()}
+
+def extract_social_media_links(soup, page_text=None):
+    """Extract social media profile links
     
+    page_text may be any text extracted from soup; the patterns never span
+    whitespace, so reflowed text finds the same links without another tree walk.
+    """
     social_links = {}
-    page_text = soup.get_text()
+    if page_text is None:
+        page_text = soup.get_text()
     
     # Check links in href attributes
     for link in soup.find_all('a', href=True):
         href = link.get('href')
-        for platform, pattern in social_patterns.items():
-            if re.search(pattern, href, re.IGNORECASE):
+        for platform, pattern in _SOCIAL_PATTERNS.items():
+            if pattern.search(href):
                 social_links[platform] = href
                 break
     
     # Check in text content as backup
-    for platform, pattern in social_patterns.items():
+    for platform, pattern in _SOCIAL_PATTERNS.items():
         if platform not in social_links:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = pattern.search(page_text)
             if match:
                 social_links[platform] = match.group(0)
     
     return social_links
 
+def extract_form(form):
+    """Extract a form's action, method and fields"""
+    form_data = {
+        'action': form.get('action', ''),
+        'method': form.get('method', 'get'),
+        'fields': []
+    }
+    
+    for input_field in form.find_all(['input', 'textarea', 'select']):
+        field_info = {
+            'type': input_field.get('type', input_field.name),
+            'name': input_field.get('name', ''),
+            'placeholder': input_field.get('placeholder', ''),
+            'required': input_field.has_attr('required')
+        }
+        form_data['fields'].append(field_info)
+    
+    return form_data
+
+# Action words that mark a button, link or input as a call to action
+CTA_KEYWORDS = [
+    'contact', 'call', 'phone', 'email', 'quote', 'book', 'schedule', 'order',
+    'buy', 'purchase', 'get', 'request', 'learn more', 'find out', 'discover',
+    'contactar', 'ligar', 'telefone', 'email', 'orçamento', 'marcar', 'agendar',
+    'pedir', 'solicitar', 'saber mais', 'descobrir'
+]
+# One alternation scans a label once instead of testing each keyword in turn
+_CTA_KEYWORD_RE = re.compile("|".join(map(re.escape, CTA_KEYWORDS)))
+
 def extract_ctas_and_forms(element):
     """Extract call-to-action buttons and forms"""
     ctas = []
     forms = []
     
-    # Extract CTAs (buttons, links with action words)
-    cta_keywords = [
-        'contact', 'call', 'phone', 'email', 'quote', 'book', 'schedule', 'order',
-        'buy', 'purchase', 'get', 'request', 'learn more', 'find out', 'discover',
-        'contactar', 'ligar', 'telefone', 'email', 'orçamento', 'marcar', 'agendar',
-        'pedir', 'solicitar', 'saber mais', 'descobrir'
-    ]
-    
-    for button in element.find_all(['button', 'a', 'input']):
-        text = button.get_text().strip().lower()
+    # Buttons, links, inputs and forms all come from one walk over the element
+    for button in element.find_all(['button', 'a', 'input', 'form']):
+        if button.name == 'form':
+            forms.append(extract_form(button))
+            continue
+        
+        label = button.get_text().strip()
+        text = label.lower()
         button_type = button.get('type', '')
         href = button.get('href', '')
         
         # Check if this looks like a CTA
-        if any(keyword in text for keyword in cta_keywords) or button_type == 'submit':
+        if _CTA_KEYWORD_RE.search(text) or button_type == 'submit':
             ctas.append({
-                'text': button.get_text().strip(),
+                'text': label,
                 'type': button.name,
                 'href': href,
                 'action': button_type
             })
     
-    # Extract forms
-    for form in element.find_all('form'):
-        form_data = {
-            'action': form.get('action', ''),
-            'method': form.get('method', 'get'),
-            'fields': []
-        }
-        
-        for input_field in form.find_all(['input', 'textarea', 'select']):
-            field_info = {
-                'type': input_field.get('type', input_field.name),
-                'name': input_field.get('name', ''),
-                'placeholder': input_field.get('placeholder', ''),
-                'required': input_field.has_attr('required')
-            }
-            form_data['fields'].append(field_info)
-        
-        forms.append(form_data)
-    
     return ctas, forms
 
+_SENTENCE_END_RE = re.compile(r'[.!?]')
+
+# Words that mark a sentence as describing services or products, in priority order
+SERVICE_KEYWORDS = [
+    'service', 'services', 'serviço', 'serviços', 'product', 'products', 'produto', 'produtos',
+    'solution', 'solutions', 'solução', 'soluções', 'offer', 'oferece', 'specialist', 'especialista'
+]
+_SERVICE_KEYWORD_RE = re.compile("|".join(map(re.escape, SERVICE_KEYWORDS)))
+
 def extract_business_data(soup, text_content):
     """Extract comprehensive business-critical data"""
     business_data = {}
@@ -398,7 +480,7 @@ def extract_business_data(soup, text_content):
     business_data['business_hours'] = extract_business_hours(text_content)
     
     # Extract social media
-    business_data['social_media'] = extract_social_media_links(soup)
+    business_data['social_media'] = extract_social_media_links(soup, text_content)
     
     # Extract CTAs and forms from the whole page
     ctas, forms = extract_ctas_and_forms(soup)
@@ -406,18 +488,20 @@ def extract_business_data(soup, text_content):
     business_data['forms'] = forms
     
     # Extract services/products keywords
-    service_keywords = [
-        'service', 'services', 'serviço', 'serviços', 'product', 'products', 'produto', 'produtos',
-        'solution', 'solutions', 'solução', 'soluções', 'offer', 'oferece', 'specialist', 'especialista'
+    # Split and lowercase the text once instead of once per keyword, keeping
+    # only sentences that mention at least one keyword
+    sentences = [(sentence.strip(), sentence.lower()) for sentence in _SENTENCE_END_RE.split(text_content)]
+    sentences = [
+        (stripped, lowered) for stripped, lowered in sentences
+        if len(stripped) > 10 and _SERVICE_KEYWORD_RE.search(lowered)
     ]
     
     services = []
-    for keyword in service_keywords:
+    for keyword in SERVICE_KEYWORDS:
         # Find sentences containing service keywords
-        sentences = re.split(r'[.!?]', text_content)
-        for sentence in sentences:
-            if keyword.lower() in sentence.lower() and len(sentence.strip()) > 10:
-                services.append(sentence.strip())
+        services.extend(stripped for stripped, lowered in sentences if keyword in lowered)
+        if len(services) >= 5:  # Only the first five are kept
+            break
     
     business_data['services'] = services[:5]  # Limit to top 5 service mentions
     
@@ -429,8 +513,15 @@ def extract_business_data(soup, text_content):
 
 def extract_sections(html: str, base_url: str = "") -> List[Section]:
     """Enhanced section extraction with comprehensive content capture"""
-    soup = BeautifulSoup(html, "html.parser")
+    return extract_sections_from_soup(_parse(html), base_url)
+
+
+def extract_sections_from_soup(soup: BeautifulSoup, base_url: str = "") -> List[Section]:
+    """Section extraction over an already parsed page.
     
+    Noise elements (scripts, styles, links, ...) are removed from soup in place,
+    so read anything else needed from the tree before calling this.
+    """
     logger.info(f"Starting enhanced section extraction for URL: {base_url}")
     
     # Remove noise elements
@@ -443,7 +534,10 @@ def extract_sections(html: str, base_url: str = "") -> List[Section]:
     logger.info(f"Global business data extracted: {len(global_business_data.get('phones', []))} phones, {len(global_business_data.get('emails', []))} emails")
     
     # Find all potential content containers
-    containers = find_content_containers(soup)
+    # Cleaned text per container, keyed on id(element); the tree doesn't change
+    # after noise removal, so text measured while finding containers stays valid
+    texts = {}
+    containers = find_content_containers(soup, texts)
     logger.info(f"Found {len(containers)} potential content containers")
     
     # Log container strategies
@@ -464,7 +558,9 @@ def extract_sections(html: str, base_url: str = "") -> List[Section]:
         element = container_info['element']
         
         # Extract text content
-        text_content = extract_text_content(element)
+        text_content = texts.get(id(element))
+        if text_content is None:
+            text_content = extract_text_content(element)
         word_count = len(text_content.split())
         
         # Skip containers with minimal content (less than 10 words)
@@ -477,23 +573,23 @@ def extract_sections(html: str, base_url: str = "") -> List[Section]:
         
         # Find heading within this section
         heading = ""
-        for h_level in range(1, 7):
-            h_element = element.find(f'h{h_level}')
-            if h_element:
-                heading = h_element.get_text().strip()
-                break
+        # Highest-level heading wins, the first in document order among equals
+        h_elements = element.find_all(HEADING_TAGS)
+        if h_elements:
+            h_element = min(h_elements, key=lambda h: HEADING_TAGS.index(h.name))
+            heading = h_element.get_text().strip()
         
         # Extract section-specific business data
         section_business_data = extract_business_data(element, text_content)
         
-        # Extract section-specific CTAs and forms
-        section_ctas, section_forms = extract_ctas_and_forms(element)
+        # Section-specific CTAs and forms were already extracted with the business data
+        section_ctas, section_forms = section_business_data['ctas'], section_business_data['forms']
         
         # Log section details
         logger.info(f"Section {section_id}: {word_count} words, {len(images)} images, heading: '{heading[:50]}...', strategy: {container_info['strategy']}")
         logger.info(f"  Section business data: {len(section_business_data.get('phones', []))} phones, {len(section_ctas)} CTAs, {len(section_forms)} forms")
         
-        # Create section
+        # Create section; only containers that become sections are serialized
         section = Section(
             html=str(element),
             tag=container_info['tag'],
@@ -652,99 +748,172 @@ def extract_sections_with_brand(html: str, base_url: str = "") -> tuple:
     return sections, brand_dict
 
 
-def _parse(html_str):
-    return BeautifulSoup(html_str, "html.parser")
+# Upper bound on pages fetched concurrently within one crawl
+FETCH_WORKERS = 8
 
+# Sent on every request; many sites answer the default python-requests agent with 403.
+# Accept-Encoding is left to requests, which adds br to gzip/deflate when brotli is installed.
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
 
-def scrape_site(url: str, max_pages: int = 5) -> MultiPageScrapeResult:
-    minio_endpoint = os.getenv("MINIO_ENDPOINT", "minio:9000")
-    minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
-    minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
-    minio_bucket = os.getenv("MINIO_BUCKET", "pagelift-assets")
-    
-    # Fix endpoint URL construction
-    if not minio_endpoint.startswith(('http://', 'https://')):
-        minio_endpoint = f"http://{minio_endpoint}"
-    
-    s3 = boto3.client(
-        "s3",
-        endpoint_url=minio_endpoint,
-        aws_access_key_id=minio_access_key,
-        aws_secret_access_key=minio_secret_key,
-        region_name="us-east-1",
+
+def _new_session() -> requests.Session:
+    """HTTP session that keeps connections alive across the pages of one crawl"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(BROWSER_HEADERS)
+    return session
+
+
+def _close_sessions(sessions: List[requests.Session]):
+    """Close the per-worker sessions of a finished crawl"""
+    for session in sessions:
+        session.close()
+
+
+def _fetch_html(session: requests.Session, page_url: str) -> Optional[Tuple[str, bytes]]:
+    """Fetch a page's decoded HTML and raw body.
+    
+    Returns None when the request fails but a headless browser can retry it.
+    """
+    try:
+        resp = session.get(page_url, timeout=30)
+        resp.raise_for_status()
+        return resp.text, resp.content
+    except HTTPError:
+        if not PLAYWRIGHT_AVAILABLE:
+            raise
+        return None
+
+
+def _browser_html(browser, page_url: str) -> str:
+    """Load a page in a fresh tab of an already running browser"""
+    page = browser.new_page()
+    try:
+        page.goto(page_url, timeout=30000)
+        return page.content()
+    finally:
+        page.close()
+
+
+def _upload_original_html(s3, bucket: str, key: str, body: bytes):
+    """Store a page's original HTML gzip-compressed; HTML typically shrinks 5-8x"""
+    # The key stays the same; ContentEncoding lets HTTP clients decompress transparently
+    s3.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=gzip.compress(body, compresslevel=6),
+        ContentEncoding="gzip",
+        ContentType="text/html",
     )
+
+
+def _same_domain_links(page_url, hrefs, domain, visited):
+    """Resolve hrefs against page_url, keeping unvisited links on domain"""
+    links = set()
+    for href in hrefs:
+        link = _join(page_url, href)
+        if _netloc(link) == domain and link not in visited:
+            links.add(link)
+    return links
+
+
+def scrape_site(url: str, max_pages: int = 5) -> MultiPageScrapeResult:
+    # Shared, pooled MinIO client; one configuration and connection pool per process
+    s3 = get_s3_client()
     visited = set()
-    to_visit = [url]
+    to_visit = deque([url])
+    queued = {url}  # Everything ever put on to_visit, for O(1) membership checks
     pages = []
+    uploads = []
     domain = urlparse(url).netloc
-    while to_visit and len(pages) < max_pages:
-        page_url = to_visit.pop(0)
-        if page_url in visited:
-            continue
-        visited.add(page_url)
-        try:
-            resp = requests.get(page_url, timeout=30)
-            try:
-                resp.raise_for_status()
-            except HTTPError as e:
-                if resp.status_code == 403:
-                    # Retry with User-Agent
-                    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"}
-                    resp = requests.get(page_url, timeout=30, headers=headers)
-                    resp.raise_for_status()
+    # requests doesn't promise a Session is thread-safe, so each fetch worker keeps
+    # its own keep-alive session for the whole crawl; pages mostly share a host
+    worker = threading.local()
+    sessions = []  # Every worker's session, closed once the crawl is done
+    
+    def fetch(page_url):
+        session = getattr(worker, "session", None)
+        if session is None:
+            session = worker.session = _new_session()
+            sessions.append(session)
+        return _fetch_html(session, page_url)
+    
+    # Chromium for the Playwright fallback starts on first use and is shared by
+    # the rest of the crawl; the sync API is thread-bound, so it stays on this thread
+    browser = None
+    # The stack is entered first so sessions and the browser close after the pool shuts down
+    with ExitStack() as stack, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        stack.callback(_close_sessions, sessions)
+        while to_visit and len(pages) < max_pages:
+            # Fetch everything queued so far concurrently, then process the
+            # pages in queue order so the crawl matches a sequential one
+            batch = []
+            while to_visit and len(pages) + len(batch) < max_pages:
+                page_url = to_visit.popleft()
+                if page_url in visited:
+                    continue
+                visited.add(page_url)
+                batch.append(page_url)
+            fetched = pool.map(fetch, batch)
+            for pending, (page_url, response) in enumerate(zip(batch, fetched), start=1):
+                if response is not None:
+                    html, body = response
                 else:
-                    raise
-            html = resp.text
-        except HTTPError as e:
-            # Playwright fallback
-            if PLAYWRIGHT_AVAILABLE:
-                with sync_playwright() as p:
-                    browser = p.chromium.launch()
-                    page = browser.new_page()
-                    page.goto(page_url, timeout=30000)
-                    html = page.content()
-                    browser.close()
-            else:
-                raise
-        # Parse HTML synchronously
-        soup = _parse(html)
-        # Find assets
-        assets = set()
-        for img in soup.find_all("img"):
-            src = img.get("src")
-            if src:
-                assets.add(urljoin(page_url, src))
-        for link in soup.find_all("link", rel="stylesheet"):
-            href = link.get("href")
-            if href:
-                assets.add(urljoin(page_url, href))
-        # Find nav links (same domain)
-        nav_links = set()
-        for nav in soup.find_all("nav"):
-            for a in nav.find_all("a", href=True):
-                link = urljoin(page_url, a["href"])
-                if urlparse(link).netloc == domain and link not in visited:
-                    nav_links.add(link)
-        if not nav_links:
-            for a in soup.find_all("a", href=True, recursive=False):
-                link = urljoin(page_url, a["href"])
-                if urlparse(link).netloc == domain and link not in visited:
-                    nav_links.add(link)
-        # Add new nav links to to_visit
-        for link in nav_links:
-            if link not in visited and link not in to_visit and len(pages) + len(to_visit) < max_pages:
-                to_visit.append(link)
-        # Save HTML to MinIO
-        parsed = urlparse(page_url)
-        key = f"S3_ORIGINAL/{parsed.netloc}{parsed.path if parsed.path else ''}.html"
-        key = key.replace("//", "/")
-        s3.put_object(Bucket=minio_bucket, Key=key, Body=html.encode("utf-8"))
-        # Extract sections
-        sections = extract_sections(html, page_url)
-        pages.append(PageScrape(
-            url=page_url,
-            html=html,
-            assets=list(assets),
-            sections=sections
-        ))
+                    # Playwright fallback
+                    if browser is None:
+                        browser = stack.enter_context(sync_playwright()).chromium.launch()
+                        stack.callback(browser.close)
+                    html = _browser_html(browser, page_url)
+                    body = html.encode("utf-8")
+                # Parse HTML synchronously
+                soup = _parse(html)
+                # Find assets and nav links (same domain) in one walk over the tree,
+                # collecting raw URLs first so repeated ones are resolved only once
+                asset_urls = set()
+                nav_hrefs = set()
+                for el in soup.find_all(("img", "link", "nav")):
+                    if el.name == "img":
+                        src = el.get("src")
+                        if src:
+                            asset_urls.add(src)
+                    elif el.name == "link":
+                        href = el.get("href")
+                        if href and "stylesheet" in (el.get("rel") or ()):
+                            asset_urls.add(href)
+                    else:
+                        nav_hrefs.update(a["href"] for a in el.find_all("a", href=True))
+                assets = {_join(page_url, src) for src in asset_urls}
+                nav_links = _same_domain_links(page_url, nav_hrefs, domain, visited)
+                if not nav_links:
+                    hrefs = {a["href"] for a in soup.find_all("a", href=True, recursive=False)}
+                    nav_links = _same_domain_links(page_url, hrefs, domain, visited)
+                # Add new nav links to to_visit; pages of this batch still
+                # awaiting processing count towards max_pages
+                in_flight = len(batch) - pending
+                for link in nav_links:
+                    if link not in visited and link not in queued and len(pages) + in_flight + len(to_visit) < max_pages:
+                        to_visit.append(link)
+                        queued.add(link)
+                # Save HTML to MinIO as fetched, without re-encoding the decoded text;
+                # the upload runs in the background so it overlaps parsing and the next fetches
+                parsed = urlparse(page_url)
+                key = f"S3_ORIGINAL/{parsed.netloc}{parsed.path if parsed.path else ''}.html"
+                key = key.replace("//", "/")
+                uploads.append(pool.submit(_upload_original_html, s3, MINIO_BUCKET, key, body))
+                # Extract sections from the same tree; this strips noise elements, so it runs last
+                sections = extract_sections_from_soup(soup, page_url)
+                pages.append(PageScrape(
+                    url=page_url,
+                    html=html,
+                    assets=list(assets),
+                    sections=sections
+                ))
+        # Surface any upload failure before handing the pages back
+        for upload in uploads:
+            upload.result()
     return MultiPageScrapeResult(pages=pages) 
\ No newline at end of file
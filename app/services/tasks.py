@@ -1,9 +1,10 @@
 import os
+from dataclasses import asdict
 from celery import Celery
 from app.services.scrape import scrape_site
 from app.services.parse import parse_html_sections
 from app.services.analyze import analyze_sections, persist_analysis_output
-from app.services.render import render_site_with_brand, upload_and_set_output
+from app.services.render import render_site_with_brand_bytes, upload_site_zip
 from app.services.brand_extraction import extract_brand_identity
 from app.models import Project, Job
 from app.config import settings
@@ -41,7 +42,7 @@ def pipeline_task(job_id: int, url: str):
             
             # Synchronous parse
             sections = parse_html_sections(html)
-            section_dicts = [s.__dict__ for s in sections]
+            section_dicts = [asdict(s) for s in sections]
             
             # Synchronous analyze
             analyses = analyze_sections(section_dicts)
@@ -94,31 +95,11 @@ def pipeline_task(job_id: int, url: str):
                 }
             }
             
-            # Synchronous render with brand
-            zip_path = render_site_with_brand([a.__dict__ for a in analyses], brand_identity, title=job.project.name)
+            # Synchronous render with brand; the zip stays in memory
+            zip_bytes = render_site_with_brand_bytes([a.__dict__ for a in analyses], brand_identity, title=job.project.name)
             
-            # Upload to MinIO (needs to be made sync)
-            minio_endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000")
-            minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
-            minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
-            minio_bucket = os.getenv("MINIO_BUCKET", "pagelift-assets")
-            
-            import boto3
-            # Fix endpoint URL construction - don't add http:// if already present
-            if not minio_endpoint.startswith(('http://', 'https://')):
-                minio_endpoint = f"http://{minio_endpoint}"
-            
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=minio_endpoint,
-                aws_access_key_id=minio_access_key,
-                aws_secret_access_key=minio_secret_key,
-                region_name="us-east-1",
-            )
-            
-            key = f"S3_GENERATED/site_{job_id}.zip"
-            with open(zip_path, 'rb') as f:
-                s3.put_object(Bucket=minio_bucket, Key=key, Body=f)
+            # Stream the bundle straight to MinIO
+            key = upload_site_zip(job_id, zip_bytes)
             
             job.output_zip_url = key
             job.status = "complete"
@@ -271,7 +271,7 @@ def validate_extraction_pipeline(
     from bs4 import BeautifulSoup
     
     # Analyze original content
-    soup = BeautifulSoup(original_html, 'html.parser')
+    soup = BeautifulSoup(original_html, 'lxml')
     
     # Remove noise
     for noise in soup(['script', 'style', 'meta', 'link', 'noscript']):
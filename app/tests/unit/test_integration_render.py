@@ -1,3 +1,4 @@
+from dataclasses import asdict
 import pytest
 from unittest.mock import patch, MagicMock
 from app.services.scrape import scrape_site
@@ -20,13 +21,14 @@ HTML_FIXTURE = '''
 @pytest.mark.integration
 def test_full_scrape_parse_analyze_render(tmp_path):
     # --- Scrape (simulate single page) ---
-    with patch("app.services.scrape.requests.get") as mock_get, \
-         patch("app.services.scrape.boto3.client") as mock_boto:
+    with patch("app.services.scrape.requests.Session.get") as mock_get, \
+         patch("app.services.scrape.get_s3_client") as mock_get_s3_client:
         mock_resp = MagicMock()
         mock_resp.text = HTML_FIXTURE
+        mock_resp.content = HTML_FIXTURE.encode("utf-8")
         mock_resp.raise_for_status = lambda: None
         mock_get.return_value = mock_resp
-        mock_boto.return_value = MagicMock()
+        mock_get_s3_client.return_value = MagicMock()
         result = scrape_site("http://example.com", max_pages=1)
         html = result.pages[0].html
     # --- Parse ---
@@ -43,7 +45,7 @@ def test_full_scrape_parse_analyze_render(tmp_path):
             }]
         }
         # Convert dataclasses to dicts for analyze_sections
-        section_dicts = [s.__dict__ for s in sections]
+        section_dicts = [asdict(s) for s in sections]
         analyzed = analyze_sections(section_dicts)
     # --- Render ---
     zip_path = render_site([a.__dict__ for a in analyzed], title="Test Site")
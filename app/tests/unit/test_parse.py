@@ -48,4 +48,25 @@ def test_parse_divs():
     assert any("services" in s.classes for s in sections)
     assert any("gallery" == s.id for s in sections)
     assert any("/img/s1.png" in s.img_urls for s in sections)
-    assert any("/img/g1.png" in s.img_urls for s in sections) 
\ No newline at end of file
+    assert any("/img/g1.png" in s.img_urls for s in sections)
+
+
+SERVICES_COPY = (
+    "We repair leaking pipes, install new boilers and service heating systems for homes "
+    "and businesses across the city. Our licensed team offers same day visits, fixed prices "
+    "and a twelve month guarantee on every job we complete for our customers."
+)
+
+HTML_NEAR_DUPLICATES = f'''
+<body>
+  <section id="services"><h2>Services</h2><p>{SERVICES_COPY}</p></section>
+  <section id="about"><h2>About</h2><p>Family owned since 1998, we have grown from one van to a team of twenty engineers.</p></section>
+  <section id="services-repeat"><p>Accept cookies to continue.</p><h2>Services</h2><p>{SERVICES_COPY}</p></section>
+</body>
+'''
+
+def test_parse_drops_shifted_near_duplicates():
+    sections = parse_html_sections(HTML_NEAR_DUPLICATES)
+    assert len(sections) == 2
+    assert [s.id for s in sections] == ["services", "about"]
+    assert [s.section_id for s in sections] == [0, 1]
@@ -0,0 +1,39 @@
+import io
+import os
+import zipfile
+from app.services.render import render_site, render_site_bytes
+
+SECTIONS = [
+    {
+        "section_id": 0,
+        "category": "hero",
+        "heading": "Welcome",
+        "short_copy": "Hello there.",
+        "img_urls": [
+            "https://cdn.example.com/remote.png",
+            "//cdn.example.com/protocol-relative.png",
+            "data:image/png;base64,iVBORw0KGgo=",
+            "/blocks/hero.html",
+            "../config.py",
+        ],
+    },
+]
+
+def test_render_site_bytes_bundles_local_assets():
+    zip_bytes = render_site_bytes(SECTIONS, title="Test Site")
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
+        names = z.namelist()
+        assert "index.html" in names
+        assert "Welcome" in z.read("index.html").decode("utf-8")
+    # Local assets are bundled; remote URLs and paths outside the templates dir are not
+    assert "blocks/hero.html" in names
+    assert not any("remote.png" in n or "protocol-relative" in n or "config.py" in n for n in names)
+    assert len(names) == 2
+
+def test_render_site_writes_zip_path():
+    zip_path = render_site(SECTIONS, title="Test Site")
+    try:
+        with zipfile.ZipFile(zip_path) as z:
+            assert "index.html" in z.namelist()
+    finally:
+        os.unlink(zip_path)
@@ -37,9 +37,9 @@ HTML_CONTACT = '''
 </html>
 '''
 
-@patch("app.services.scrape.boto3.client")
-@patch("app.services.scrape.requests.get")
-def test_multi_page_scrape_and_section_extraction(mock_get, mock_boto):
+@patch("app.services.scrape.get_s3_client")
+@patch("app.services.scrape.requests.Session.get")
+def test_multi_page_scrape_and_section_extraction(mock_get, mock_get_s3_client):
     # Mock responses for each URL
     def side_effect(url, *args, **kwargs):
         mock_resp = MagicMock()
@@ -49,11 +49,12 @@ def test_multi_page_scrape_and_section_extraction(mock_get, mock_boto):
             mock_resp.text = HTML_CONTACT
         else:
             mock_resp.text = HTML_MAIN
+        mock_resp.content = mock_resp.text.encode("utf-8")
         mock_resp.raise_for_status = lambda: None
         return mock_resp
     mock_get.side_effect = side_effect
     mock_s3 = MagicMock()
-    mock_boto.return_value = mock_s3
+    mock_get_s3_client.return_value = mock_s3
 
     url = "http://example.com"
     result = scrape_site(url, max_pages=3)
@@ -73,7 +74,7 @@ def test_multi_page_scrape_and_section_extraction(mock_get, mock_boto):
     # S3 put_object called for each page
     assert mock_s3.put_object.call_count == 3 
 
-def test_403_retry_with_user_agent(monkeypatch):
+def test_browser_user_agent_sent_up_front(monkeypatch):
     from app.services import scrape
     calls = []
     class MockResp:
@@ -85,20 +86,40 @@ def test_403_retry_with_user_agent(monkeypatch):
                 raise requests.exceptions.HTTPError(response=self)
         @property
         def content(self):
-            return self.text
-    def mock_get(url, timeout=30, headers=None):
-        calls.append(headers)
-        if not headers:
+            return self.text.encode("utf-8")
+    def mock_get(session, url, timeout=30, headers=None):
+        calls.append(dict(session.headers))
+        if "User-Agent" not in session.headers or "python-requests" in session.headers["User-Agent"]:
             return MockResp(403, "blocked")
         else:
             return MockResp(200, "<html><body><section>ok</section></body></html>")
-    monkeypatch.setattr(scrape.requests, "get", mock_get)
+    monkeypatch.setattr(scrape.requests.Session, "get", mock_get)
     class DummyS3:
         def put_object(self, **kwargs):
             pass
-    monkeypatch.setattr(scrape.boto3, "client", lambda *a, **kw: DummyS3())
+    monkeypatch.setattr(scrape, "get_s3_client", lambda: DummyS3())
     result = scrape.scrape_site("http://fake.com", max_pages=1)
-    assert len(calls) == 2  # First without UA, then with UA
-    assert calls[0] is None
-    assert calls[1] is not None and "User-Agent" in calls[1]
-    assert result.pages[0].html == "<html><body><section>ok</section></body></html>" 
\ No newline at end of file
+    assert len(calls) == 1  # Browser User-Agent on the first request, no 403 round-trip
+    assert "Chrome" in calls[0]["User-Agent"]
+    assert result.pages[0].html == "<html><body><section>ok</section></body></html>" 
+
+def test_deduplicate_containers_keeps_outermost_and_unique_markup():
+    from bs4 import BeautifulSoup
+    from app.services.scrape import deduplicate_containers
+    soup = BeautifulSoup(
+        "<div id='outer'><section id='inner'>Inner</section></div>"
+        "<p>Same</p><p>Same</p>",
+        "lxml",
+    )
+    inner, outer = soup.find(id="inner"), soup.find(id="outer")
+    first, second = soup.find_all("p")
+    containers = [
+        {'element': inner, 'priority': 1},
+        {'element': inner, 'priority': 2},
+        {'element': outer, 'priority': 3},
+        {'element': first, 'priority': 3},
+        {'element': second, 'priority': 4},
+    ]
+    kept = [id(c['element']) for c in deduplicate_containers(containers)]
+    # The outer div replaces the section nested in it; identical paragraphs collapse to one
+    assert kept == [id(outer), id(first)]
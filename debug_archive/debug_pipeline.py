@@ -4,6 +4,7 @@ Debug script to test the entire website generation pipeline step by step
 """
 import requests
 import json
+from dataclasses import asdict
 from app.services.scrape import scrape_site
 from app.services.parse import parse_html_sections
 from app.services.analyze import analyze_sections
@@ -29,7 +30,7 @@ def test_pipeline():
     print("\n2. PARSING...")
     try:
         sections = parse_html_sections(html)
-        section_dicts = [s.__dict__ for s in sections]
+        section_dicts = [asdict(s) for s in sections]
         print(f"✅ Parsed {len(sections)} sections")
         for i, section in enumerate(sections):
             print(f"  Section {i}: {len(section.text.split())} words, {len(section.img_urls)} images")
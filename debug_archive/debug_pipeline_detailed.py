@@ -5,6 +5,7 @@ Focus on finding why we get "major icons, insanely long pages, left-aligned text
 """
 import requests
 import json
+from dataclasses import asdict
 from app.services.scrape import scrape_site
 from app.services.parse import parse_html_sections, SectionData
 from app.services.analyze import analyze_sections
@@ -67,7 +68,7 @@ def debug_comprehensive_pipeline():
         return
         
     # Convert to dicts for next steps
-    section_dicts = [s.__dict__ for s in sections]
+    section_dicts = [asdict(s) for s in sections]
     
     # Step 3: Analysis Quality Check
     print("\n3️⃣ ANALYSIS QUALITY CHECK...")
@@ -16,6 +16,7 @@ Focus areas:
 import os
 import sys
 import json
+from dataclasses import asdict
 import tempfile
 import zipfile
 from pathlib import Path
@@ -267,7 +268,7 @@ def debug_pipeline_comprehensive(url="https://desentopecanalizacoes.pt/"):
         # Parsing
         print("2️⃣ Parsing HTML sections...")
         sections = parse_html_sections(html)
-        section_dicts = [s.__dict__ for s in sections]
+        section_dicts = [asdict(s) for s in sections]
         print(f"   ✅ Extracted {len(sections)} sections")
         
         # Analysis
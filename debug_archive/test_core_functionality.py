@@ -135,7 +135,8 @@ def test_pipeline_components_independently():
     try:
         # Test imports
         from app.services.scrape import scrape_site
-        from app.services.parse import parse_html_sections  
+        from dataclasses import asdict
+        from app.services.parse import parse_html_sections
         from app.services.analyze import analyze_sections
         from app.services.render import render_site_with_brand
         from app.services.brand_extraction import extract_brand_identity
@@ -164,7 +165,7 @@ def test_pipeline_components_independently():
         # Test analysis (might require OpenAI API)
         print("   Testing analysis (requires OpenAI API)...")
         try:
-            section_dicts = [s.__dict__ for s in sections[:3]]  # Test with first 3 sections
+            section_dicts = [asdict(s) for s in sections[:3]]  # Test with first 3 sections
             analyses = analyze_sections(section_dicts)
             if analyses:
                 print(f"   ✅ Analysis successful ({len(analyses)} analyses)")
@@ -4,6 +4,7 @@ Test script to verify the template context fix for image_set and typography
 """
 
 import sys
+from collections.abc import Sequence
 from pathlib import Path
 
 # Add the project root to Python path
@@ -47,7 +48,7 @@ def test_prepare_section_with_defaults():
     image_set = context['image_set']
     print(f"📷 image_set keys: {list(image_set.keys())}")
     assert image_set['primary_image'] is None, "❌ primary_image should be None by default"
-    assert isinstance(image_set['all_images'], list), "❌ all_images should be a list"
+    assert isinstance(image_set['all_images'], Sequence), "❌ all_images should be a sequence"
     
     typography = context['typography']
     print(f"📝 typography keys: {list(typography.keys())}")